@@ -2,6 +2,8 @@
 
 import { useEffect } from "react";
 import { useRouter } from "next/navigation";
+import { useQueryClient } from "@tanstack/react-query";
+import { contact } from "@/lib/api";
 import { useAuthStore } from "@/lib/auth-store";
 import { Sidebar } from "@/components/sidebar";
 
@@ -11,12 +13,38 @@ export default function DashboardLayout({
   children: React.ReactNode;
 }) {
   const router = useRouter();
+  const queryClient = useQueryClient();
   const { token, isLoading, checkAuth } = useAuthStore();
 
   useEffect(() => {
     checkAuth();
   }, [checkAuth]);
 
+  // Keep inbox queries fresh from the server's event stream instead of polling
+  useEffect(() => {
+    if (!token) return;
+
+    const controller = new AbortController();
+    const listen = async () => {
+      while (!controller.signal.aborted) {
+        try {
+          await contact.events(() => {
+            queryClient.invalidateQueries({ queryKey: ["contact"] });
+          }, controller.signal);
+        } catch {
+          // Dropped or refused; retry below
+        }
+        if (controller.signal.aborted) return;
+        // Changes may have been missed while disconnected
+        queryClient.invalidateQueries({ queryKey: ["contact"] });
+        await new Promise((resolve) => setTimeout(resolve, 5000));
+      }
+    };
+    listen();
+
+    return () => controller.abort();
+  }, [token, queryClient]);
+
   useEffect(() => {
     if (!isLoading && !token) {
       router.replace("/auth/login");
@@ -13,19 +13,84 @@ class ApiError extends Error {
   }
 }
 
-async function request<T>(endpoint: string, options: RequestOptions = {}): Promise<T> {
-  const token = typeof window !== "undefined" ? localStorage.getItem("token") : null;
+export type TokenPair = {
+  access_token: string;
+  refresh_token: string;
+  token_type: string;
+  expires_in: number;
+};
+
+export function storeTokens({ access_token, refresh_token }: TokenPair) {
+  localStorage.setItem("token", access_token);
+  localStorage.setItem("refresh_token", refresh_token);
+}
+
+export function clearTokens() {
+  localStorage.removeItem("token");
+  localStorage.removeItem("refresh_token");
+}
+
+// Access tokens are short-lived; one refresh at a time, since refresh tokens are single-use
+let refreshing: Promise<boolean> | null = null;
+
+// Every tab shares the tokens in localStorage, so refreshes are also serialized across tabs
+function withRefreshLock<T>(callback: () => Promise<T>): Promise<T> {
+  // Without Web Locks, the server's reuse grace period covers tabs refreshing together
+  if (!("locks" in navigator)) return callback();
+  return navigator.locks.request("auth-refresh", callback) as Promise<T>;
+}
+
+function refreshAccessToken(rejectedToken: string | null): Promise<boolean> {
+  refreshing ??= withRefreshLock(async () => {
+    // Another tab renewed the tokens while this one waited for the lock
+    if (localStorage.getItem("token") !== rejectedToken) return true;
+
+    const refresh_token = localStorage.getItem("refresh_token");
+    if (!refresh_token) return false;
+
+    const response = await fetch(`${API_BASE}/auth/refresh`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ refresh_token }),
+    }).catch(() => null);
+    if (!response?.ok) {
+      if (response?.status === 401) clearTokens();
+      return false;
+    }
+    storeTokens(await response.json());
+    return true;
+  }).finally(() => {
+    refreshing = null;
+  });
+  return refreshing;
+}
+
+// Retries once with a refreshed access token when the current one is rejected
+async function authorizedFetch(url: string, init: RequestInit = {}): Promise<Response> {
+  const currentToken = () => (typeof window !== "undefined" ? localStorage.getItem("token") : null);
+  const send = (token: string | null) => {
+    const headers = new Headers(init.headers);
+    if (token) headers.set("Authorization", `Bearer ${token}`);
+    return fetch(url, { ...init, headers });
+  };
 
+  const token = currentToken();
+  const response = await send(token);
+  const retry =
+    response.status === 401 && typeof window !== "undefined" && (await refreshAccessToken(token));
+  if (retry) {
+    return send(currentToken());
+  }
+  return response;
+}
+
+async function request<T>(endpoint: string, options: RequestOptions = {}): Promise<T> {
   const headers: Record<string, string> = {
     "Content-Type": "application/json",
     ...options.headers,
   };
 
-  if (token) {
-    headers["Authorization"] = `Bearer ${token}`;
-  }
-
-  const response = await fetch(`${API_BASE}${endpoint}`, {
+  const response = await authorizedFetch(`${API_BASE}${endpoint}`, {
     method: options.method || "GET",
     headers,
     body: options.body ? JSON.stringify(options.body) : undefined,
@@ -68,6 +133,8 @@ export const auth = {
       });
     }),
   me: () => request<User>("/auth/me"),
+  logout: () => request<void>("/auth/logout", { method: "POST" }),
+  logoutAll: () => request<void>("/auth/logout-all", { method: "POST" }),
   register: (data: { email: string; password: string; full_name: string }) =>
     request<User>("/auth/register", { method: "POST", body: data }),
 };
@@ -89,7 +156,7 @@ export async function login(email: string, password: string) {
     throw new ApiError(response.status, error.detail);
   }
 
-  return response.json() as Promise<{ access_token: string; token_type: string }>;
+  return response.json() as Promise<TokenPair>;
 }
 
 export async function getMe() {
@@ -143,6 +210,38 @@ export const contact = {
     request<void>(`/contact/${id}`, { method: "DELETE" }),
   stats: () => request<{ total: number; unread: number; archived: number }>("/contact/stats"),
   markAllRead: () => request<void>("/contact/mark-all-read", { method: "POST" }),
+  // Server-sent events for inbox changes; resolves when the stream ends or signal aborts
+  events: async (onEvent: (event: string, data: unknown) => void, signal: AbortSignal) => {
+    const response = await authorizedFetch(`${API_BASE}/contact/events`, {
+      headers: { Accept: "text/event-stream" },
+      signal,
+    });
+    if (!response.ok || !response.body) {
+      throw new ApiError(response.status, "Event stream unavailable");
+    }
+
+    const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+    let buffer = "";
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) return;
+      buffer += value;
+
+      let boundary: number;
+      while ((boundary = buffer.indexOf("\n\n")) !== -1) {
+        const block = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+
+        let event = "message";
+        let data = "";
+        for (const line of block.split("\n")) {
+          if (line.startsWith("event: ")) event = line.slice(7);
+          else if (line.startsWith("data: ")) data += line.slice(6);
+        }
+        if (data) onEvent(event, JSON.parse(data));
+      }
+    }
+  },
 };
 
 // Types
@@ -1,6 +1,6 @@
 import { create } from "zustand";
 import { persist } from "zustand/middleware";
-import { login as apiLogin, getMe, type User } from "./api";
+import { auth, clearTokens, login as apiLogin, getMe, storeTokens, type User } from "./api";
 
 type AuthState = {
   token: string | null;
@@ -19,16 +19,18 @@ export const useAuthStore = create<AuthState>()(
       isLoading: true,
 
       login: async (email: string, password: string) => {
-        const { access_token } = await apiLogin(email, password);
-        localStorage.setItem("token", access_token);
-        set({ token: access_token });
+        const tokens = await apiLogin(email, password);
+        storeTokens(tokens);
+        set({ token: tokens.access_token });
 
         const user = await getMe();
         set({ user });
       },
 
       logout: () => {
-        localStorage.removeItem("token");
+        // Revoke server-side too; the local session ends either way
+        if (localStorage.getItem("token")) auth.logout().catch(() => {});
+        clearTokens();
         set({ token: null, user: null });
       },
 
@@ -44,7 +46,7 @@ export const useAuthStore = create<AuthState>()(
           const user = await getMe();
           set({ user, isLoading: false });
         } catch {
-          localStorage.removeItem("token");
+          clearTokens();
           set({ token: null, user: null, isLoading: false });
         }
       },
@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.routes import auth, projects, skills, contact
+from app.api.routes import auth, projects, skills, contact, portfolio, content, images, outbox
 
 api_router = APIRouter()
 
@@ -8,3 +8,7 @@ api_router.include_router(auth.router)
 api_router.include_router(projects.router)
 api_router.include_router(skills.router)
 api_router.include_router(contact.router)
+api_router.include_router(portfolio.router)
+api_router.include_router(content.router)
+api_router.include_router(images.router)
+api_router.include_router(outbox.router)
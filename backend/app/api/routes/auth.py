@@ -1,29 +1,54 @@
-from datetime import timedelta
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.config import settings
-from app.core.database import get_db
-from app.core.security import verify_password, get_password_hash, create_access_token
-from app.core.deps import CurrentUser
+from app.core.database import get_async_db, get_db
+from app.core.rate_limit import limit_login_attempts, login_account_key, login_account_limiter
+from app.core.security import (
+    PasswordHasherBusy,
+    decode_access_claims,
+    get_password_hash,
+    password_hasher,
+    password_needs_rehash,
+)
+from app.core.deps import CurrentUser, oauth2_scheme
+from app.core.tokens import (
+    InvalidRefreshToken,
+    issue_tokens,
+    revoke_session,
+    revoke_user_tokens,
+    rotate_refresh_token,
+)
 from app.models.user import User
-from app.schemas.user import Token, UserResponse, UserCreate
+from app.schemas.user import RefreshRequest, Token, UserResponse, UserCreate
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
-@router.post("/login", response_model=Token)
-def login(
-    db: Annotated[Session, Depends(get_db)],
+@router.post("/login", response_model=Token, dependencies=[Depends(limit_login_attempts)])
+async def login(
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
 ):
-    """Login and get access token."""
-    user = db.query(User).filter(User.email == form_data.username).first()
+    """Login and get an access token and refresh token."""
+    user = await db.scalar(select(User).where(User.email == form_data.username))
+
+    try:
+        verified = user is not None and await password_hasher.verify(
+            form_data.password, user.hashed_password
+        )
+    except PasswordHasherBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress, please try again",
+            headers={"Retry-After": "1"},
+        )
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -36,18 +61,79 @@ def login(
             detail="Inactive user"
         )
 
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        subject=str(user.id), expires_delta=access_token_expires
-    )
+    login_account_limiter.reset(login_account_key(form_data.username))
+
+    # Upgrade the stored hash now that we have the plain password
+    if password_needs_rehash(user.hashed_password):
+        try:
+            user.hashed_password = await password_hasher.hash(form_data.password)
+            await db.commit()
+        except PasswordHasherBusy:
+            pass
 
-    return Token(access_token=access_token)
+    tokens = await db.run_sync(issue_tokens, user.id)
+    await db.commit()
+
+    return tokens
+
+
+@router.post("/refresh", response_model=Token)
+async def refresh(
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    body: RefreshRequest,
+):
+    """Exchange a refresh token for a new token pair (public endpoint)."""
+    try:
+        tokens = await db.run_sync(rotate_refresh_token, body.refresh_token)
+    except InvalidRefreshToken:
+        # Keep the session revocation triggered by a reused token
+        await db.commit()
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    await db.commit()
+
+    return tokens
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(
+    db: Annotated[Session, Depends(get_db)],
+    token: Annotated[str, Depends(oauth2_scheme)],
+    current_user: CurrentUser,
+):
+    """Revoke the current session's access and refresh tokens."""
+    claims = decode_access_claims(token)
+    revoke_session(db, claims.jti)
+    db.commit()
+
+
+@router.post("/logout-all", status_code=status.HTTP_204_NO_CONTENT)
+def logout_all(
+    db: Annotated[Session, Depends(get_db)],
+    current_user: CurrentUser,
+):
+    """Revoke every session of the current user, e.g. after a suspected compromise."""
+    revoke_user_tokens(db, current_user.id)
+    db.commit()
 
 
 @router.get("/me", response_model=UserResponse)
-def get_current_user_info(current_user: CurrentUser):
+def get_current_user_info(
+    db: Annotated[Session, Depends(get_db)],
+    current_user: CurrentUser,
+):
     """Get current user information."""
-    return current_user
+    user = db.get(User, current_user.id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
 
 
 @router.post("/register", response_model=UserResponse)
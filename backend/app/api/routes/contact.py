@@ -1,13 +1,24 @@
+import asyncio
+import csv
+import io
 import logging
-from typing import Annotated
+from datetime import datetime, timezone
+from typing import Annotated, Iterator
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import REAL, cast, func, literal, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.contact_stats import apply_stats_delta, read_stats, reconcile_stats
+from app.core.database import SessionLocal, get_async_db, get_db
 from app.core.deps import CurrentAdmin
-from app.core.email import send_contact_notification
-from app.models.contact import ContactSubmission
+from app.core.events import contact_events, publish_contact_event
+from app.core.outbox import enqueue_contact_notification, outbox_dispatcher
+from app.core.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from app.core.rate_limit import client_ip, limit_contact_submissions
+from app.models.contact import SEARCH_COLUMNS, ContactSubmission
 from app.schemas.contact import (
     ContactSubmissionCreate,
     ContactSubmissionUpdate,
@@ -19,18 +30,107 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/contact", tags=["Contact"])
 
+EVENTS_KEEPALIVE_SECONDS = 15
+
+EXPORT_BATCH_SIZE = 1000
+EXPORT_COLUMNS = (
+    "id",
+    "created_at",
+    "first_name",
+    "last_name",
+    "email",
+    "message",
+    "is_read",
+    "is_archived",
+    "ip_address",
+    "user_agent",
+)
+
+
+def _filter_submissions(
+    query,
+    is_read: bool | None = None,
+    is_archived: bool | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+):
+    """Apply the inbox filters to an ORM query or select()."""
+    if is_read is not None:
+        query = query.filter(ContactSubmission.is_read == is_read)
+
+    if is_archived is not None:
+        query = query.filter(ContactSubmission.is_archived == is_archived)
+
+    if created_from is not None:
+        query = query.filter(ContactSubmission.created_at >= created_from)
+
+    if created_to is not None:
+        query = query.filter(ContactSubmission.created_at < created_to)
+
+    return query
+
+
+def _csv_cell(value) -> str:
+    """Format a value for CSV, defusing spreadsheet formulas in user-supplied text."""
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    text = str(value)
+    if text[:1] in ("=", "+", "-", "@", "\t", "\r"):
+        return "'" + text
+    return text
+
+
+def _export_csv(stmt) -> Iterator[bytes]:
+    """Yield CSV chunks, one per server-side cursor batch."""
+    db = SessionLocal()
+    try:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        # BOM so spreadsheet apps detect UTF-8
+        buffer.write("\ufeff")
+        writer.writerow(EXPORT_COLUMNS)
+        yield buffer.getvalue().encode()
+
+        result = db.execute(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        for partition in result.partitions():
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows([_csv_cell(value) for value in row] for row in partition)
+            yield buffer.getvalue().encode()
+    finally:
+        db.close()
+
+
+async def _event_stream(queue: asyncio.Queue):
+    # Clients wait this long before reconnecting after a dropped stream
+    yield "retry: 5000\n\n"
+    while True:
+        try:
+            event, payload = await asyncio.wait_for(queue.get(), timeout=EVENTS_KEEPALIVE_SECONDS)
+        except asyncio.TimeoutError:
+            # Comment lines keep proxies from timing out an idle stream
+            yield ": keepalive\n\n"
+            continue
+        yield f"event: {event}\ndata: {payload}\n\n"
+
 
 # Public endpoint
-@router.post("", response_model=ContactSubmissionPublicResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "",
+    response_model=ContactSubmissionPublicResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(limit_contact_submissions)],
+)
 async def submit_contact_form(
     submission_in: ContactSubmissionCreate,
     request: Request,
-    background_tasks: BackgroundTasks,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """Submit a contact form (public endpoint)."""
     # Get client info
-    client_ip = request.client.host if request.client else None
     user_agent = request.headers.get("user-agent", "")[:500]
 
     submission = ContactSubmission(
@@ -38,21 +138,19 @@ async def submit_contact_form(
         last_name=submission_in.last_name,
         email=submission_in.email,
         message=submission_in.message,
-        ip_address=client_ip,
+        ip_address=client_ip(request),
         user_agent=user_agent,
     )
 
     db.add(submission)
-    db.commit()
-
-    # Send email notification in background
-    background_tasks.add_task(
-        send_contact_notification,
-        first_name=submission_in.first_name,
-        last_name=submission_in.last_name,
-        email=submission_in.email,
-        message=submission_in.message,
-    )
+    await db.flush()
+    await db.run_sync(apply_stats_delta, total=1, unread=1)
+    # Queued in the same transaction, so a restart can't lose the notification
+    await db.run_sync(enqueue_contact_notification, submission)
+    await db.run_sync(publish_contact_event, "submission.created", id=submission.id)
+    await db.commit()
+
+    outbox_dispatcher.wake()
     logger.info(f"Contact form submitted by {submission_in.email}, notification queued")
 
     return ContactSubmissionPublicResponse(
@@ -64,47 +162,141 @@ async def submit_contact_form(
 # Admin endpoints
 @router.get("", response_model=list[ContactSubmissionResponse])
 def list_contact_submissions(
+    response: Response,
     db: Annotated[Session, Depends(get_db)],
     admin: CurrentAdmin,
     is_read: bool | None = Query(None, description="Filter by read status"),
     is_archived: bool | None = Query(None, description="Filter by archived status"),
-    skip: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description=f"Cursor from the {NEXT_CURSOR_HEADER} header"),
+    skip: int = Query(0, ge=0, description="Ignored when cursor is set"),
     limit: int = Query(50, ge=1, le=100),
 ):
     """List all contact submissions (admin only)."""
-    query = db.query(ContactSubmission)
-
-    if is_read is not None:
-        query = query.filter(ContactSubmission.is_read == is_read)
-
-    if is_archived is not None:
-        query = query.filter(ContactSubmission.is_archived == is_archived)
+    query = _filter_submissions(db.query(ContactSubmission), is_read, is_archived)
+
+    # Keyset on (created_at, id) keeps deep pages cheap and stable while
+    # new submissions arrive at the head of the inbox
+    if cursor:
+        created_at, submission_id = decode_cursor(cursor, datetime, int)
+        query = query.filter(
+            tuple_(ContactSubmission.created_at, ContactSubmission.id) < (created_at, submission_id)
+        )
+    elif skip:
+        query = query.offset(skip)
 
     submissions = (
-        query.order_by(ContactSubmission.created_at.desc())
-        .offset(skip)
-        .limit(limit)
+        query.order_by(ContactSubmission.created_at.desc(), ContactSubmission.id.desc())
+        .limit(limit + 1)
         .all()
     )
 
+    if len(submissions) > limit:
+        submissions = submissions[:limit]
+        last = submissions[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
+
     return submissions
 
 
+@router.get("/search", response_model=list[ContactSubmissionResponse])
+def search_contact_submissions(
+    response: Response,
+    db: Annotated[Session, Depends(get_db)],
+    admin: CurrentAdmin,
+    q: str = Query(..., min_length=3, max_length=200, description="Text to find in names, email or message"),
+    is_read: bool | None = Query(None, description="Filter by read status"),
+    is_archived: bool | None = Query(None, description="Filter by archived status"),
+    cursor: str | None = Query(None, description=f"Cursor from the {NEXT_CURSOR_HEADER} header"),
+    limit: int = Query(50, ge=1, le=100),
+):
+    """Search contact submissions by substring or fuzzy match, best matches first (admin only)."""
+    # Both ILIKE and <% (word similarity) are served by the trigram GIN indexes
+    matches = or_(*(
+        or_(column.icontains(q, autoescape=True), literal(q).op("<%")(column))
+        for column in SEARCH_COLUMNS
+    ))
+    rank = func.greatest(*(func.word_similarity(q, column) for column in SEARCH_COLUMNS))
+
+    query = _filter_submissions(
+        db.query(ContactSubmission, rank.label("rank")), is_read, is_archived
+    ).filter(matches)
+
+    if cursor:
+        last_rank, last_id = decode_cursor(cursor, float, int)
+        # rank is a real; a float8 parameter would widen it and skip rows tied on rank
+        query = query.filter(
+            tuple_(rank, ContactSubmission.id) < tuple_(cast(literal(last_rank), REAL), last_id)
+        )
+
+    rows = query.order_by(rank.desc(), ContactSubmission.id.desc()).limit(limit + 1).all()
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last, last_rank = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last_rank, last.id)
+
+    return [submission for submission, _ in rows]
+
+
+@router.get("/export")
+def export_contact_submissions(
+    admin: CurrentAdmin,
+    is_read: bool | None = Query(None, description="Filter by read status"),
+    is_archived: bool | None = Query(None, description="Filter by archived status"),
+    created_from: datetime | None = Query(None, description="Submitted at or after (ISO 8601)"),
+    created_to: datetime | None = Query(None, description="Submitted before (ISO 8601)"),
+):
+    """Stream contact submissions as CSV, newest first (admin only)."""
+    stmt = _filter_submissions(
+        select(*(ContactSubmission.__table__.c[name] for name in EXPORT_COLUMNS)),
+        is_read,
+        is_archived,
+        created_from,
+        created_to,
+    ).order_by(ContactSubmission.created_at.desc(), ContactSubmission.id.desc())
+
+    filename = f"contacts-{datetime.now(timezone.utc):%Y%m%d-%H%M%S}.csv"
+    return StreamingResponse(
+        _export_csv(stmt),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/events")
+async def stream_contact_events(admin: CurrentAdmin):
+    """Stream inbox changes as server-sent events (admin only)."""
+    async def stream():
+        async with contact_events.subscribe() as queue:
+            async for chunk in _event_stream(queue):
+                yield chunk
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/stats")
 def get_contact_stats(
     db: Annotated[Session, Depends(get_db)],
     admin: CurrentAdmin,
 ):
     """Get contact submission statistics (admin only)."""
-    total = db.query(ContactSubmission).count()
-    unread = db.query(ContactSubmission).filter(ContactSubmission.is_read == False).count()
-    archived = db.query(ContactSubmission).filter(ContactSubmission.is_archived == True).count()
+    return read_stats(db)
 
-    return {
-        "total": total,
-        "unread": unread,
-        "archived": archived,
-    }
+
+@router.post("/stats/reconcile")
+def reconcile_contact_stats(
+    db: Annotated[Session, Depends(get_db)],
+    admin: CurrentAdmin,
+):
+    """Recompute the stats counters from the submissions table (admin only)."""
+    drift = reconcile_stats(db)
+    db.commit()
+
+    return {"drift": drift, **read_stats(db)}
 
 
 @router.get("/{submission_id}", response_model=ContactSubmissionResponse)
@@ -141,10 +333,24 @@ def update_contact_submission(
             detail="Contact submission not found"
         )
 
+    was_read, was_archived = submission.is_read, submission.is_archived
+
     update_data = submission_in.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(submission, field, value)
 
+    apply_stats_delta(
+        db,
+        unread=int(was_read) - int(submission.is_read),
+        archived=int(submission.is_archived) - int(was_archived),
+    )
+    publish_contact_event(
+        db,
+        "submission.updated",
+        id=submission.id,
+        is_read=submission.is_read,
+        is_archived=submission.is_archived,
+    )
     db.commit()
     db.refresh(submission)
 
@@ -166,6 +372,13 @@ def delete_contact_submission(
             detail="Contact submission not found"
         )
 
+    apply_stats_delta(
+        db,
+        total=-1,
+        unread=-int(not submission.is_read),
+        archived=-int(submission.is_archived),
+    )
+    publish_contact_event(db, "submission.deleted", id=submission.id)
     db.delete(submission)
     db.commit()
 
@@ -176,9 +389,12 @@ def mark_all_as_read(
     admin: CurrentAdmin,
 ):
     """Mark all contact submissions as read (admin only)."""
-    db.query(ContactSubmission).filter(ContactSubmission.is_read == False).update(
+    marked = db.query(ContactSubmission).filter(ContactSubmission.is_read == False).update(
         {"is_read": True}
     )
+    apply_stats_delta(db, unread=-marked)
+    if marked:
+        publish_contact_event(db, "submissions.read_all", count=marked)
     db.commit()
 
     return {"message": "All submissions marked as read"}
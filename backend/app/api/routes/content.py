@@ -0,0 +1,314 @@
+import logging
+from datetime import datetime, timezone
+from typing import Annotated, Iterator, Literal, get_args
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from sqlalchemy import func, insert, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.core.bundle import portfolio_bundle
+from app.core.cache import response_cache
+from app.core.database import SessionLocal, get_db
+from app.core.deps import CurrentAdmin
+from app.models.contact import ContactSubmission
+from app.models.project import Project, project_search_vector
+from app.models.skill import Skill, SkillCategory
+from app.schemas.content import (
+    ContentImportResult,
+    ContentLine,
+    ContactSubmissionRecord,
+    ContactSubmissionLine,
+    ProjectLine,
+    ProjectRecord,
+    SkillCategoryLine,
+    SkillCategoryRecord,
+    SkillLine,
+    SkillRecord,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/content", tags=["Content"])
+
+BATCH_SIZE = 500
+MAX_LINE_BYTES = 1024 * 1024
+
+ContentKind = Literal["projects", "skill_categories", "skills", "contact_submissions"]
+
+_content_line_adapter = TypeAdapter(ContentLine)
+
+
+def _record_columns(table, record: type[BaseModel]) -> list:
+    return [table.c[name] for name in record.model_fields if name in table.c]
+
+
+def _export_lines(kinds: set[str]) -> Iterator[bytes]:
+    """Yield NDJSON chunks, one per server-side cursor batch."""
+    db = SessionLocal()
+    try:
+        exports = []
+        if "projects" in kinds:
+            exports.append((
+                ProjectLine,
+                select(*_record_columns(Project.__table__, ProjectRecord)).order_by(Project.id),
+            ))
+        if "skill_categories" in kinds:
+            exports.append((
+                SkillCategoryLine,
+                select(*_record_columns(SkillCategory.__table__, SkillCategoryRecord))
+                .order_by(SkillCategory.id),
+            ))
+        if "skills" in kinds:
+            exports.append((
+                SkillLine,
+                select(
+                    *_record_columns(Skill.__table__, SkillRecord),
+                    SkillCategory.slug.label("category_slug"),
+                )
+                .join(SkillCategory, Skill.category_id == SkillCategory.id)
+                .order_by(Skill.id),
+            ))
+        if "contact_submissions" in kinds:
+            exports.append((
+                ContactSubmissionLine,
+                select(*_record_columns(ContactSubmission.__table__, ContactSubmissionRecord))
+                .order_by(ContactSubmission.id),
+            ))
+
+        for line_model, stmt in exports:
+            record_model = line_model.model_fields["data"].annotation
+            result = db.execute(stmt.execution_options(yield_per=BATCH_SIZE))
+            for partition in result.partitions():
+                yield b"".join(
+                    line_model(data=record_model.model_validate(row, from_attributes=True))
+                    .model_dump_json()
+                    .encode()
+                    + b"\n"
+                    for row in partition
+                )
+    finally:
+        db.close()
+
+
+def _upsert_projects(db: Session, records: list[ProjectRecord]) -> None:
+    # ON CONFLICT cannot touch the same row twice in one statement
+    by_slug = {record.slug: record for record in records}
+
+    rows = []
+    for record in by_slug.values():
+        row = record.model_dump()
+        row["created_at"] = record.created_at or func.now()
+        row["search_vector"] = project_search_vector(
+            record.title,
+            " ".join(record.technologies),
+            record.description,
+            record.long_description,
+        )
+        rows.append(row)
+
+    stmt = pg_insert(Project).values(rows)
+    updated = {
+        name: stmt.excluded[name]
+        for name in rows[0]
+        if name not in ("slug", "created_at")
+    }
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[Project.slug],
+            set_={**updated, "updated_at": func.now()},
+        )
+    )
+
+
+def _upsert_skill_categories(db: Session, records: list[SkillCategoryRecord]) -> None:
+    by_slug = {record.slug: record for record in records}
+    rows = [record.model_dump() for record in by_slug.values()]
+
+    stmt = pg_insert(SkillCategory).values(rows)
+    updated = {name: stmt.excluded[name] for name in rows[0] if name != "slug"}
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[SkillCategory.slug],
+            set_={**updated, "updated_at": func.now()},
+        )
+    )
+
+
+def _upsert_skills(db: Session, records: list[SkillRecord]) -> None:
+    """Upsert skills keyed by (category slug, name)."""
+    slugs = {record.category_slug for record in records}
+    category_ids = dict(
+        db.execute(
+            select(SkillCategory.slug, SkillCategory.id).where(SkillCategory.slug.in_(slugs))
+        ).all()
+    )
+    missing = slugs - category_ids.keys()
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown skill category: {sorted(missing)[0]}"
+        )
+
+    rows = {}
+    for record in records:
+        row = record.model_dump(exclude={"category_slug"})
+        row["category_id"] = category_ids[record.category_slug]
+        rows[(row["category_id"], row["name"])] = row
+
+    existing = dict(
+        ((category_id, name), skill_id)
+        for category_id, name, skill_id in db.execute(
+            select(Skill.category_id, Skill.name, Skill.id).where(
+                tuple_(Skill.category_id, Skill.name).in_(list(rows))
+            )
+        ).all()
+    )
+
+    now = datetime.now(timezone.utc)
+    updates = [
+        {**row, "id": existing[key], "updated_at": now}
+        for key, row in rows.items()
+        if key in existing
+    ]
+    inserts = [row for key, row in rows.items() if key not in existing]
+
+    if updates:
+        db.execute(update(Skill), updates)
+    if inserts:
+        db.execute(insert(Skill), inserts)
+
+
+def _insert_contact_submissions(db: Session, records: list[ContactSubmissionRecord]) -> None:
+    """Insert submissions not already present, matched on (email, created_at)."""
+    rows = {(record.email, record.created_at): record.model_dump() for record in records}
+
+    existing = {
+        (email, created_at)
+        for email, created_at in db.execute(
+            select(ContactSubmission.email, ContactSubmission.created_at).where(
+                tuple_(ContactSubmission.email, ContactSubmission.created_at).in_(list(rows))
+            )
+        ).all()
+    }
+    inserts = [row for key, row in rows.items() if key not in existing]
+
+    if inserts:
+        db.execute(insert(ContactSubmission), inserts)
+
+
+_WRITERS = {
+    "project": ("projects", _upsert_projects),
+    "skill_category": ("skill_categories", _upsert_skill_categories),
+    "skill": ("skills", _upsert_skills),
+    "contact_submission": ("contact_submissions", _insert_contact_submissions),
+}
+
+
+class _ContentImporter:
+    """
+    Buffers parsed lines and writes them in per-type batches.
+
+    A batch is flushed when it is full or when the record type changes, so
+    the input order (categories before their skills) is preserved. Each
+    batch commits on its own; the upserts make re-running an import safe.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.result = ContentImportResult()
+        self._type: str | None = None
+        self._batch: list[BaseModel] = []
+
+    async def add(self, line_no: int, line: bytes) -> None:
+        if not line.strip():
+            return
+
+        try:
+            parsed = _content_line_adapter.validate_json(line)
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Line {line_no}: {e.errors(include_url=False)[0]['msg']}"
+            )
+
+        if parsed.type != self._type or len(self._batch) >= BATCH_SIZE:
+            await self.flush()
+            self._type = parsed.type
+
+        self._batch.append(parsed.data)
+
+    async def flush(self) -> None:
+        if not self._batch:
+            return
+
+        field, writer = _WRITERS[self._type]
+        batch, self._batch = self._batch, []
+        await run_in_threadpool(self._write, writer, batch)
+        setattr(self.result, field, getattr(self.result, field) + len(batch))
+
+    def _write(self, writer, batch: list[BaseModel]) -> None:
+        try:
+            writer(self.db, batch)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+
+# Admin endpoints
+@router.get("/export")
+def export_content(
+    admin: CurrentAdmin,
+    include: list[ContentKind] | None = Query(None, description="Content types to export (default: all)"),
+):
+    """Stream portfolio content and contact submissions as NDJSON (admin only)."""
+    kinds = set(include or get_args(ContentKind))
+    filename = f"portfolio-{datetime.now(timezone.utc):%Y%m%d-%H%M%S}.ndjson"
+
+    return StreamingResponse(
+        _export_lines(kinds),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post("/import", response_model=ContentImportResult)
+async def import_content(
+    request: Request,
+    db: Annotated[Session, Depends(get_db)],
+    admin: CurrentAdmin,
+):
+    """Import an NDJSON export, upserting projects and categories by slug (admin only)."""
+    importer = _ContentImporter(db)
+    line_no = 0
+    pending = b""
+
+    try:
+        async for chunk in request.stream():
+            pending += chunk
+            *lines, pending = pending.split(b"\n")
+            if len(pending) > MAX_LINE_BYTES:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"Line {line_no + 1} exceeds {MAX_LINE_BYTES} bytes"
+                )
+
+            for line in lines:
+                line_no += 1
+                await importer.add(line_no, line)
+
+        line_no += 1
+        await importer.add(line_no, pending)
+        await importer.flush()
+    finally:
+        response_cache.invalidate("projects")
+        response_cache.invalidate("skills")
+        portfolio_bundle.invalidate()
+
+    logger.info(f"Content import finished: {importer.result.model_dump()}")
+
+    return importer.result
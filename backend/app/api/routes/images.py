@@ -0,0 +1,53 @@
+import logging
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+
+from app.core.images import (
+    IMAGE_FORMATS,
+    IMAGE_WIDTHS,
+    derivative_cache,
+    derivatives_available,
+    resolve_source,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/images", tags=["Images"])
+
+
+# Public endpoint
+@router.get("/{width}/{path:path}")
+async def get_image_derivative(
+    width: int,
+    path: str,
+    format: Literal["webp", "jpeg"] = Query("webp", description="Output format"),
+):
+    """Get a resized, recompressed copy of an image under /static (public endpoint)."""
+    if width not in IMAGE_WIDTHS:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Width must be one of {list(IMAGE_WIDTHS)}"
+        )
+
+    source = resolve_source(path)
+    if source is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Image not found"
+        )
+
+    if not derivatives_available():
+        logger.warning("Pillow not installed. Serving original image.")
+        return FileResponse(source)
+
+    derivative = await run_in_threadpool(derivative_cache.get, source, width, format)
+
+    _, media_type = IMAGE_FORMATS[format]
+    return FileResponse(
+        derivative,
+        media_type=media_type,
+        headers={"Cache-Control": "public, max-age=86400"},
+    )
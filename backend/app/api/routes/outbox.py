@@ -0,0 +1,34 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import get_async_db, get_db
+from app.core.deps import CurrentAdmin
+from app.core.email import smtp_pool
+from app.core.outbox import outbox_dispatcher, queue_depth, retry_failed
+
+router = APIRouter(prefix="/outbox", tags=["Outbox"])
+
+
+@router.get("")
+def get_outbox_depth(
+    db: Annotated[Session, Depends(get_db)],
+    admin: CurrentAdmin,
+):
+    """Get the email outbox queue depth and SMTP pool metrics (admin only)."""
+    return {**queue_depth(db), "smtp_pool": smtp_pool.stats()}
+
+
+@router.post("/retry")
+async def retry_failed_messages(
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    admin: CurrentAdmin,
+):
+    """Requeue messages that exhausted their retries (admin only)."""
+    requeued = await db.run_sync(retry_failed)
+    await db.commit()
+    outbox_dispatcher.wake()
+
+    return {"requeued": requeued}
@@ -0,0 +1,39 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.bundle import portfolio_bundle
+from app.core.database import get_async_db
+from app.core.etag import accepted_encodings, encoded_etag, etag_matches, not_modified_response
+from app.schemas.portfolio import PortfolioBundleResponse
+
+router = APIRouter(prefix="/portfolio", tags=["Portfolio"])
+
+
+@router.get("", response_model=PortfolioBundleResponse)
+async def get_portfolio_bundle(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+):
+    """Get all published projects, skill categories and site metadata in one document (public endpoint)."""
+    # A fresh snapshot returns without touching the database
+    snapshot = await db.run_sync(portfolio_bundle.get)
+
+    encoding = "gzip" if "gzip" in accepted_encodings(request) else None
+    etag = encoded_etag(snapshot.etag, encoding)
+    if etag_matches(request, etag):
+        response = not_modified_response(etag)
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        return Response(content=snapshot.gzip_body, media_type="application/json", headers=headers)
+
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
@@ -1,62 +1,263 @@
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import Select, and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.bundle import portfolio_bundle
+from app.core.bulk import bulk_update, ensure_unique_ids
+from app.core.cache import response_cache
+from app.core.database import get_async_db, get_db
 from app.core.deps import CurrentAdmin
-from app.models.project import Project
+from app.core.etag import etag_matches, json_response, make_etag, not_modified_response
+from app.core.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from app.models.project import SEARCH_CONFIG, SEARCH_FIELDS, Project, project_search_vector
 from app.schemas.project import (
     ProjectCreate,
     ProjectUpdate,
+    ProjectBulkPatch,
     ProjectResponse,
     ProjectListResponse,
+    TechnologyFacet,
 )
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
+_project_list_adapter = TypeAdapter(list[ProjectListResponse])
+_technology_facet_adapter = TypeAdapter(list[TechnologyFacet])
+
+
+def _invalidate_project_cache(*slugs: str) -> None:
+    """Drop cached public responses affected by a project write."""
+    response_cache.invalidate("projects", "list")
+    response_cache.invalidate("projects", "technologies")
+    response_cache.invalidate("projects", "search")
+    for slug in slugs:
+        response_cache.invalidate("projects", "detail", slug)
+    portfolio_bundle.invalidate()
+
+
+def _paginate(
+    query: Select,
+    cursor: str | None,
+    skip: int,
+    limit: int,
+) -> Select:
+    """
+    Apply the listing sort order and page bounds to a project query.
+
+    Pages after the first are located by keyset on
+    (display_order, created_at DESC, id DESC) when a cursor is given, falling
+    back to offset pagination via skip otherwise. One extra row is fetched
+    so _split_page can tell whether another page follows.
+    """
+    if cursor:
+        display_order, created_at, project_id = decode_cursor(cursor, int, datetime, int)
+        query = query.where(
+            or_(
+                Project.display_order > display_order,
+                and_(
+                    Project.display_order == display_order,
+                    or_(
+                        Project.created_at < created_at,
+                        and_(Project.created_at == created_at, Project.id < project_id),
+                    ),
+                ),
+            )
+        )
+    elif skip:
+        query = query.offset(skip)
+
+    return (
+        query.order_by(Project.display_order, Project.created_at.desc(), Project.id.desc())
+        .limit(limit + 1)
+    )
+
+
+def _split_page(projects: list[Project], limit: int) -> tuple[list[Project], str | None]:
+    """Return the page of projects and the cursor for the next page, if any."""
+    next_cursor = None
+    if len(projects) > limit:
+        projects = projects[:limit]
+        last = projects[-1]
+        next_cursor = encode_cursor(last.display_order, last.created_at, last.id)
+
+    return projects, next_cursor
+
+
+def _set_search_vector(project: Project) -> None:
+    """Recompute the full-text document from the project's current fields."""
+    project.search_vector = project_search_vector(
+        project.title,
+        " ".join(project.technologies or []),
+        project.description,
+        project.long_description,
+    )
+
+
+async def _projects_version(db: AsyncSession) -> tuple:
+    """Return (max updated_at, row count) over all projects."""
+    return (await db.execute(select(func.max(Project.updated_at), func.count(Project.id)))).one()
+
 
 # Public endpoints
 @router.get("", response_model=list[ProjectListResponse])
-def list_projects(
-    db: Annotated[Session, Depends(get_db)],
-    technology: str | None = Query(None, description="Filter by technology"),
+async def list_projects(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    technology: list[str] | None = Query(None, description="Filter by technology (repeatable)"),
+    match: Literal["all", "any"] = Query(
+        "all", description="Require all of the given technologies, or any of them"
+    ),
     featured: bool | None = Query(None, description="Filter by featured status"),
-    skip: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description=f"Cursor from the {NEXT_CURSOR_HEADER} header"),
+    skip: int = Query(0, ge=0, description="Ignored when cursor is set"),
     limit: int = Query(100, ge=1, le=100),
 ):
     """List all published projects (public endpoint)."""
-    query = db.query(Project).filter(Project.is_published == True)
-
-    if technology:
-        query = query.filter(Project.technologies.contains([technology]))
+    technologies = tuple(sorted(set(technology))) if technology else ()
+    cache_key = ("projects", "list", technologies, match, featured, cursor, skip, limit)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        etag, body, headers = cached
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        return json_response(body, etag, headers)
+
+    # Cheap aggregate first, so revalidations skip the row query entirely
+    etag = make_etag(*await _projects_version(db), *cache_key)
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+
+    query = select(Project).where(Project.is_published == True)
+
+    # Both @> and && are served by the GIN index on technologies
+    if technologies and match == "all":
+        query = query.where(Project.technologies.contains(list(technologies)))
+    elif technologies:
+        query = query.where(Project.technologies.overlap(list(technologies)))
 
     if featured is not None:
-        query = query.filter(Project.is_featured == featured)
+        query = query.where(Project.is_featured == featured)
+
+    rows = await db.scalars(_paginate(query, cursor, skip, limit))
+    projects, next_cursor = _split_page(rows.all(), limit)
 
-    projects = (
-        query.order_by(Project.display_order, Project.created_at.desc())
+    body = _project_list_adapter.dump_json(
+        _project_list_adapter.validate_python(projects, from_attributes=True)
+    )
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+    response_cache.set(cache_key, (etag, body, headers))
+
+    return json_response(body, etag, headers)
+
+
+@router.get("/technologies", response_model=list[TechnologyFacet])
+async def list_technology_facets(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+):
+    """List technologies used by published projects with project counts (public endpoint)."""
+    cache_key = ("projects", "technologies")
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        etag, body = cached
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        return json_response(body, etag)
+
+    etag = make_etag(*await _projects_version(db), *cache_key)
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+
+    used = (
+        select(
+            Project.id.label("project_id"),
+            func.unnest(Project.technologies).label("name"),
+        )
+        .where(Project.is_published == True)
+        .subquery()
+    )
+    project_count = func.count(used.c.project_id.distinct())
+    rows = (await db.execute(
+        select(used.c.name, project_count.label("count"))
+        .group_by(used.c.name)
+        .order_by(project_count.desc(), used.c.name)
+    )).all()
+
+    body = _technology_facet_adapter.dump_json(
+        _technology_facet_adapter.validate_python(
+            [{"name": name, "count": count} for name, count in rows]
+        )
+    )
+    response_cache.set(cache_key, (etag, body))
+
+    return json_response(body, etag)
+
+
+@router.get("/search", response_model=list[ProjectListResponse])
+async def search_projects(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    q: str = Query(..., min_length=1, max_length=200, description="Search terms"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+):
+    """Full-text search over published projects, best matches first (public endpoint)."""
+    cache_key = ("projects", "search", q, skip, limit)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        etag, body = cached
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        return json_response(body, etag)
+
+    etag = make_etag(*await _projects_version(db), *cache_key)
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+
+    ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    projects = (await db.scalars(
+        select(Project)
+        .where(Project.is_published == True, Project.search_vector.op("@@")(ts_query))
+        .order_by(func.ts_rank_cd(Project.search_vector, ts_query).desc(), Project.id)
         .offset(skip)
         .limit(limit)
-        .all()
+    )).all()
+
+    body = _project_list_adapter.dump_json(
+        _project_list_adapter.validate_python(projects, from_attributes=True)
     )
+    response_cache.set(cache_key, (etag, body))
 
-    return projects
+    return json_response(body, etag)
 
 
 @router.get("/{slug}", response_model=ProjectResponse)
-def get_project(
+async def get_project(
     slug: str,
-    db: Annotated[Session, Depends(get_db)],
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     preview: bool = Query(False, description="Include unpublished (requires auth)"),
 ):
     """Get a single project by slug (public endpoint)."""
-    query = db.query(Project).filter(Project.slug == slug)
+    cache_key = ("projects", "detail", slug, preview)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        etag, body = cached
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        return json_response(body, etag)
+
+    query = select(Project).where(Project.slug == slug)
 
     if not preview:
-        query = query.filter(Project.is_published == True)
+        query = query.where(Project.is_published == True)
 
-    project = query.first()
+    project = (await db.scalars(query.limit(1))).first()
 
     if not project:
         raise HTTPException(
@@ -64,25 +265,32 @@ def get_project(
             detail="Project not found"
         )
 
-    return project
+    body = ProjectResponse.model_validate(project).model_dump_json().encode()
+    etag = make_etag(body)
+    response_cache.set(cache_key, (etag, body))
+
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+    return json_response(body, etag)
 
 
 # Admin endpoints
 @router.get("/admin/all", response_model=list[ProjectResponse])
 def list_all_projects_admin(
+    response: Response,
     db: Annotated[Session, Depends(get_db)],
     admin: CurrentAdmin,
-    skip: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description=f"Cursor from the {NEXT_CURSOR_HEADER} header"),
+    skip: int = Query(0, ge=0, description="Ignored when cursor is set"),
     limit: int = Query(100, ge=1, le=100),
 ):
     """List all projects including unpublished (admin only)."""
-    projects = (
-        db.query(Project)
-        .order_by(Project.display_order, Project.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    rows = db.scalars(_paginate(select(Project), cursor, skip, limit))
+    projects, next_cursor = _split_page(rows.all(), limit)
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
     return projects
 
 
@@ -114,14 +322,50 @@ def create_project(
         is_published=project_in.is_published,
         display_order=project_in.display_order,
     )
+    _set_search_vector(project)
 
     db.add(project)
     db.commit()
     db.refresh(project)
+    _invalidate_project_cache(project.slug)
 
     return project
 
 
+@router.patch("", response_model=list[ProjectResponse])
+def bulk_update_projects(
+    patches: Annotated[list[ProjectBulkPatch], Body(max_length=500)],
+    db: Annotated[Session, Depends(get_db)],
+    admin: CurrentAdmin,
+):
+    """Update order and visibility of many projects in one transaction (admin only)."""
+    ensure_unique_ids(patches)
+
+    rows = bulk_update(
+        db,
+        Project,
+        patches,
+        fields=("display_order", "is_featured", "is_published"),
+        returning=(Project.slug,),
+    )
+    if len(rows) != len(patches):
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+
+    db.commit()
+    _invalidate_project_cache(*(slug for _, slug in rows))
+
+    return (
+        db.query(Project)
+        .filter(Project.id.in_([patch.id for patch in patches]))
+        .order_by(Project.display_order, Project.created_at.desc(), Project.id.desc())
+        .all()
+    )
+
+
 @router.patch("/{project_id}", response_model=ProjectResponse)
 def update_project(
     project_id: int,
@@ -138,6 +382,7 @@ def update_project(
             detail="Project not found"
         )
 
+    previous_slug = project.slug
     update_data = project_in.model_dump(exclude_unset=True)
 
     # Handle images separately if provided
@@ -147,8 +392,12 @@ def update_project(
     for field, value in update_data.items():
         setattr(project, field, value)
 
+    if any(field in update_data for field in SEARCH_FIELDS):
+        _set_search_vector(project)
+
     db.commit()
     db.refresh(project)
+    _invalidate_project_cache(previous_slug, project.slug)
 
     return project
 
@@ -168,8 +417,10 @@ def delete_project(
             detail="Project not found"
         )
 
+    slug = project.slug
     db.delete(project)
     db.commit()
+    _invalidate_project_cache(slug)
 
 
 @router.post("/{project_id}/reorder", response_model=ProjectResponse)
@@ -191,5 +442,6 @@ def reorder_project(
     project.display_order = new_order
     db.commit()
     db.refresh(project)
+    _invalidate_project_cache(project.slug)
 
     return project
@@ -1,68 +1,115 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
-
-from app.core.database import get_db
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, status
+from pydantic import TypeAdapter
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.bundle import portfolio_bundle
+from app.core.bulk import bulk_update, ensure_unique_ids
+from app.core.cache import response_cache
+from app.core.database import get_async_db, get_db
 from app.core.deps import CurrentAdmin
-from app.models.skill import Skill, SkillCategory
+from app.core.etag import etag_matches, json_response, make_etag, not_modified_response
+from app.models.skill import Skill, SkillCategory, load_published_skill_tree
 from app.schemas.skill import (
     SkillCreate,
     SkillUpdate,
+    SkillBulkPatch,
     SkillResponse,
     SkillCategoryCreate,
     SkillCategoryUpdate,
+    SkillCategoryBulkPatch,
     SkillCategoryResponse,
     SkillCategoryListResponse,
 )
 
 router = APIRouter(prefix="/skills", tags=["Skills"])
 
+_category_list_adapter = TypeAdapter(list[SkillCategoryListResponse])
+
+
+def _invalidate_category_cache(*slugs: str) -> None:
+    """Drop cached public responses affected by a category or skill write."""
+    response_cache.invalidate("skills", "categories", "list")
+    for slug in slugs:
+        response_cache.invalidate("skills", "categories", "detail", slug)
+    portfolio_bundle.invalidate()
+
+
+def _skill_tree_version(db: Session) -> tuple:
+    """Return (max updated_at, row count) for categories and skills in one round trip."""
+    return db.execute(
+        select(
+            select(func.max(SkillCategory.updated_at)).scalar_subquery(),
+            select(func.count(SkillCategory.id)).scalar_subquery(),
+            select(func.max(Skill.updated_at)).scalar_subquery(),
+            select(func.count(Skill.id)).scalar_subquery(),
+        )
+    ).one()
+
 
 # Public endpoints - Categories
 @router.get("/categories", response_model=list[SkillCategoryListResponse])
-def list_skill_categories(
-    db: Annotated[Session, Depends(get_db)],
+async def list_skill_categories(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """List all published skill categories with their skills (public endpoint)."""
-    categories = (
-        db.query(SkillCategory)
-        .filter(SkillCategory.is_published == True)
-        .order_by(SkillCategory.display_order)
-        .all()
+    cache_key = ("skills", "categories", "list")
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        etag, body = cached
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        return json_response(body, etag)
+
+    # Cheap aggregate first, so revalidations skip the row query entirely
+    etag = make_etag(*await db.run_sync(_skill_tree_version))
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+
+    categories = await db.run_sync(load_published_skill_tree)
+
+    body = _category_list_adapter.dump_json(
+        _category_list_adapter.validate_python(categories)
     )
+    response_cache.set(cache_key, (etag, body))
 
-    # Filter out unpublished skills from each category
-    for category in categories:
-        category.skills = [s for s in category.skills if s.is_published]
-        category.skills.sort(key=lambda s: s.display_order)
-
-    return categories
+    return json_response(body, etag)
 
 
 @router.get("/categories/{slug}", response_model=SkillCategoryResponse)
-def get_skill_category(
+async def get_skill_category(
     slug: str,
-    db: Annotated[Session, Depends(get_db)],
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """Get a single skill category by slug (public endpoint)."""
-    category = (
-        db.query(SkillCategory)
-        .filter(SkillCategory.slug == slug, SkillCategory.is_published == True)
-        .first()
-    )
+    cache_key = ("skills", "categories", "detail", slug)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        etag, body = cached
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        return json_response(body, etag)
 
-    if not category:
+    categories = await db.run_sync(load_published_skill_tree, slug=slug)
+
+    if not categories:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Skill category not found"
         )
 
-    # Filter unpublished skills
-    category.skills = [s for s in category.skills if s.is_published]
-    category.skills.sort(key=lambda s: s.display_order)
+    body = SkillCategoryResponse.model_validate(categories[0]).model_dump_json().encode()
+    etag = make_etag(body)
+    response_cache.set(cache_key, (etag, body))
 
-    return category
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+    return json_response(body, etag)
 
 
 # Admin endpoints - Categories
@@ -74,6 +121,7 @@ def list_all_categories_admin(
     """List all skill categories including unpublished (admin only)."""
     categories = (
         db.query(SkillCategory)
+        .options(selectinload(SkillCategory.skills))
         .order_by(SkillCategory.display_order)
         .all()
     )
@@ -98,10 +146,45 @@ def create_skill_category(
     db.add(category)
     db.commit()
     db.refresh(category)
+    _invalidate_category_cache(category.slug)
 
     return category
 
 
+@router.patch("/categories", response_model=list[SkillCategoryResponse])
+def bulk_update_skill_categories(
+    patches: Annotated[list[SkillCategoryBulkPatch], Body(max_length=500)],
+    db: Annotated[Session, Depends(get_db)],
+    admin: CurrentAdmin,
+):
+    """Update order and visibility of many skill categories in one transaction (admin only)."""
+    ensure_unique_ids(patches)
+
+    rows = bulk_update(
+        db,
+        SkillCategory,
+        patches,
+        fields=("display_order", "is_published"),
+        returning=(SkillCategory.slug,),
+    )
+    if len(rows) != len(patches):
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Skill category not found"
+        )
+
+    db.commit()
+    _invalidate_category_cache(*(slug for _, slug in rows))
+
+    return (
+        db.query(SkillCategory)
+        .filter(SkillCategory.id.in_([patch.id for patch in patches]))
+        .order_by(SkillCategory.display_order)
+        .all()
+    )
+
+
 @router.patch("/categories/{category_id}", response_model=SkillCategoryResponse)
 def update_skill_category(
     category_id: int,
@@ -118,12 +201,14 @@ def update_skill_category(
             detail="Skill category not found"
         )
 
+    previous_slug = category.slug
     update_data = category_in.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(category, field, value)
 
     db.commit()
     db.refresh(category)
+    _invalidate_category_cache(previous_slug, category.slug)
 
     return category
 
@@ -143,8 +228,10 @@ def delete_skill_category(
             detail="Skill category not found"
         )
 
+    slug = category.slug
     db.delete(category)
     db.commit()
+    _invalidate_category_cache(slug)
 
 
 # Admin endpoints - Skills
@@ -167,10 +254,50 @@ def create_skill(
     db.add(skill)
     db.commit()
     db.refresh(skill)
+    _invalidate_category_cache(category.slug)
 
     return skill
 
 
+@router.patch("", response_model=list[SkillResponse])
+def bulk_update_skills(
+    patches: Annotated[list[SkillBulkPatch], Body(max_length=500)],
+    db: Annotated[Session, Depends(get_db)],
+    admin: CurrentAdmin,
+):
+    """Update order and visibility of many skills in one transaction (admin only)."""
+    ensure_unique_ids(patches)
+
+    rows = bulk_update(
+        db,
+        Skill,
+        patches,
+        fields=("display_order", "is_published"),
+        returning=(Skill.category_id,),
+    )
+    if len(rows) != len(patches):
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Skill not found"
+        )
+
+    category_slugs = db.scalars(
+        select(SkillCategory.slug).where(
+            SkillCategory.id.in_({category_id for _, category_id in rows})
+        )
+    ).all()
+    db.commit()
+    _invalidate_category_cache(*category_slugs)
+
+    return (
+        db.query(Skill)
+        .filter(Skill.id.in_([patch.id for patch in patches]))
+        .order_by(Skill.category_id, Skill.display_order)
+        .all()
+    )
+
+
 @router.patch("/{skill_id}", response_model=SkillResponse)
 def update_skill(
     skill_id: int,
@@ -187,6 +314,7 @@ def update_skill(
             detail="Skill not found"
         )
 
+    affected_slugs = [skill.category.slug]
     update_data = skill_in.model_dump(exclude_unset=True)
 
     # If changing category, verify it exists
@@ -197,12 +325,14 @@ def update_skill(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Skill category not found"
             )
+        affected_slugs.append(category.slug)
 
     for field, value in update_data.items():
         setattr(skill, field, value)
 
     db.commit()
     db.refresh(skill)
+    _invalidate_category_cache(*affected_slugs)
 
     return skill
 
@@ -222,5 +352,7 @@ def delete_skill(
             detail="Skill not found"
         )
 
+    category_slug = skill.category.slug
     db.delete(skill)
     db.commit()
+    _invalidate_category_cache(category_slug)
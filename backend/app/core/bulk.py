@@ -0,0 +1,62 @@
+"""Single-statement bulk updates from lists of row patches."""
+
+from typing import Sequence
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy import Row, cast, column, func, update, values
+from sqlalchemy.orm import Session
+
+
+def ensure_unique_ids(patches: Sequence[BaseModel]) -> None:
+    """Reject patch lists that are empty or target the same row twice."""
+    ids = [p.id for p in patches]
+    if not ids or len(ids) != len(set(ids)):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Patches must be non-empty with unique ids"
+        )
+
+
+def bulk_update(
+    db: Session,
+    model: type,
+    patches: Sequence[BaseModel],
+    fields: Sequence[str],
+    returning: Sequence = (),
+) -> list[Row]:
+    """
+    Apply many partial row updates in one UPDATE ... FROM (VALUES ...).
+
+    Each patch must carry an ``id``; any of ``fields`` left as None keeps
+    the row's current value. The caller owns the transaction.
+
+    Args:
+        db: Database session
+        model: Mapped class to update
+        patches: Row patches with ``id`` and optional ``fields``
+        fields: Patchable column names
+        returning: Extra columns to return for each updated row
+
+    Returns:
+        One row of (id, *returning) per updated row
+    """
+    table = model.__table__
+    patch = values(
+        column("id", table.c.id.type),
+        *(column(field, table.c[field].type) for field in fields),
+        name="patch",
+    ).data([(p.id, *(getattr(p, field) for field in fields)) for p in patches])
+
+    # Casts keep all-NULL VALUES columns from being typed as text
+    stmt = (
+        update(model)
+        .where(table.c.id == cast(patch.c.id, table.c.id.type))
+        .values({
+            field: func.coalesce(cast(patch.c[field], table.c[field].type), table.c[field])
+            for field in fields
+        })
+        .returning(table.c.id, *returning)
+        .execution_options(synchronize_session=False)
+    )
+    return db.execute(stmt).all()
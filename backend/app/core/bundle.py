@@ -0,0 +1,132 @@
+"""Precomputed portfolio bundle served straight from memory."""
+
+import gzip
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.etag import make_etag
+from app.core.static_assets import CV_FILE, static_manifest
+from app.models.project import Project
+from app.models.skill import load_published_skill_tree
+from app.schemas.portfolio import PortfolioBundleResponse, PortfolioMeta
+from app.schemas.project import ProjectListResponse
+from app.schemas.skill import SkillCategoryListResponse
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BundleSnapshot:
+    generation: int
+    built_at: float
+    etag: str
+    body: bytes
+    gzip_body: bytes
+    cv_url: str | None
+
+
+def build_bundle(db: Session, cv_url: str | None = None) -> bytes:
+    """Serialize all published projects, categories and skills into one JSON document."""
+    projects = (
+        db.query(Project)
+        .filter(Project.is_published == True)
+        .order_by(Project.display_order, Project.created_at.desc(), Project.id.desc())
+        .all()
+    )
+    skill_categories = [
+        SkillCategoryListResponse.model_validate(category)
+        for category in load_published_skill_tree(db)
+    ]
+
+    bundle = PortfolioBundleResponse(
+        meta=PortfolioMeta(
+            name=settings.APP_NAME,
+            docs=f"{settings.API_V1_PREFIX}/docs",
+            health="/health",
+            cv=cv_url,
+        ),
+        projects=[ProjectListResponse.model_validate(project) for project in projects],
+        skill_categories=skill_categories,
+    )
+    return bundle.model_dump_json().encode()
+
+
+class PortfolioBundle:
+    """
+    Holds the latest serialized bundle for this process.
+
+    Admin writes call invalidate(), which bumps the generation and rebuilds
+    the bundle on a single background thread. A reader that arrives before
+    the rebuild lands builds it inline, so nobody is served a bundle older
+    than the last local write. Snapshots also expire after
+    CACHE_TTL_SECONDS to pick up writes made through other workers.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._generation = 0
+        self._snapshot: BundleSnapshot | None = None
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="portfolio-bundle")
+
+    def _is_fresh(self, snapshot: BundleSnapshot | None) -> bool:
+        return (
+            snapshot is not None
+            and snapshot.generation == self._generation
+            and time.monotonic() - snapshot.built_at < self.ttl
+            # Replacing the CV changes its hashed URL; the old one no longer resolves
+            and snapshot.cv_url == static_manifest.url_for(CV_FILE)
+        )
+
+    def _build(self, db: Session) -> BundleSnapshot:
+        generation = self._generation
+        cv_url = static_manifest.url_for(CV_FILE)
+        body = build_bundle(db, cv_url)
+        snapshot = BundleSnapshot(
+            generation=generation,
+            built_at=time.monotonic(),
+            etag=make_etag(body),
+            body=body,
+            gzip_body=gzip.compress(body, compresslevel=6),
+            cv_url=cv_url,
+        )
+
+        with self._lock:
+            if self._snapshot is None or self._snapshot.generation <= generation:
+                self._snapshot = snapshot
+        return snapshot
+
+    def get(self, db: Session) -> BundleSnapshot:
+        """Return the current snapshot, building it with db if stale."""
+        snapshot = self._snapshot
+        if self._is_fresh(snapshot):
+            return snapshot
+        return self._build(db)
+
+    def invalidate(self) -> None:
+        """Mark the bundle stale and schedule a background rebuild."""
+        with self._lock:
+            self._generation += 1
+        self._executor.submit(self._rebuild)
+
+    def _rebuild(self) -> None:
+        if self._is_fresh(self._snapshot):
+            return
+
+        db = SessionLocal()
+        try:
+            self._build(db)
+        except Exception as e:
+            logger.error(f"Failed to rebuild portfolio bundle: {e}")
+        finally:
+            db.close()
+
+
+portfolio_bundle = PortfolioBundle(ttl=settings.CACHE_TTL_SECONDS)
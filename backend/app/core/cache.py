@@ -0,0 +1,84 @@
+"""In-process cache for serialized public API responses."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from app.core.config import settings
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache with per-entry TTL.
+
+    Keys are tuples whose first element is a namespace (usually the route),
+    followed by the query parameters that shape the response. Entries can be
+    dropped individually or by key prefix, so writers can invalidate exactly
+    the responses they affect.
+
+    The cache is per-process: other workers pick up changes once their own
+    entries expire, which is what CACHE_TTL_SECONDS bounds.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Any | None:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: tuple, value: Any) -> None:
+        """Store value under key, evicting the least recently used entries."""
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *prefix: Hashable) -> int:
+        """
+        Drop every entry whose key starts with prefix.
+
+        Args:
+            prefix: Namespace, optionally followed by leading key parts
+
+        Returns:
+            Number of entries removed
+        """
+        size = len(prefix)
+        with self._lock:
+            stale = [key for key in self._entries if key[:size] == prefix]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+response_cache = ResponseCache(
+    maxsize=settings.CACHE_MAX_ENTRIES,
+    ttl=settings.CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,117 @@
+"""Contact submission statistics, aggregated on read or from a counter row."""
+
+import asyncio
+import logging
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.contact import ContactStats, ContactSubmission
+
+logger = logging.getLogger(__name__)
+
+STATS_ROW_ID = 1
+
+
+def counters_enabled() -> bool:
+    return settings.CONTACT_STATS_MODE == "counter"
+
+
+def aggregate_stats(db: Session) -> dict[str, int]:
+    """Count total, unread and archived submissions in a single scan."""
+    total, unread, archived = db.execute(
+        select(
+            func.count(),
+            func.count().filter(ContactSubmission.is_read == False),
+            func.count().filter(ContactSubmission.is_archived == True),
+        )
+    ).one()
+    return {"total": total, "unread": unread, "archived": archived}
+
+
+def read_stats(db: Session) -> dict[str, int]:
+    """Return stats from the counter row in counter mode, else aggregate."""
+    if counters_enabled():
+        row = db.get(ContactStats, STATS_ROW_ID)
+        if row is not None:
+            return {"total": row.total, "unread": row.unread, "archived": row.archived}
+        reconcile_stats(db)
+        db.commit()
+
+    return aggregate_stats(db)
+
+
+def apply_stats_delta(db: Session, total: int = 0, unread: int = 0, archived: int = 0) -> None:
+    """
+    Adjust the counter row inside the caller's transaction.
+
+    A no-op outside counter mode. Callers commit, so counters and
+    submissions change atomically.
+    """
+    if not counters_enabled() or not (total or unread or archived):
+        return
+
+    db.execute(
+        update(ContactStats)
+        .where(ContactStats.id == STATS_ROW_ID)
+        .values(
+            total=ContactStats.total + total,
+            unread=ContactStats.unread + unread,
+            archived=ContactStats.archived + archived,
+        )
+    )
+
+
+def reconcile_stats(db: Session) -> dict[str, int]:
+    """
+    Recompute the counters from contact_submissions and overwrite the row.
+
+    Returns:
+        The drift that was corrected, per counter
+    """
+    # Locking the row keeps concurrent deltas from landing between the count and the write
+    current = db.execute(
+        select(ContactStats).where(ContactStats.id == STATS_ROW_ID).with_for_update()
+    ).scalar_one_or_none()
+    actual = aggregate_stats(db)
+
+    db.execute(
+        insert(ContactStats)
+        .values(id=STATS_ROW_ID, **actual)
+        .on_conflict_do_update(
+            index_elements=[ContactStats.id],
+            set_={**actual, "updated_at": func.now()},
+        )
+    )
+
+    previous = {
+        "total": current.total if current else 0,
+        "unread": current.unread if current else 0,
+        "archived": current.archived if current else 0,
+    }
+    return {key: actual[key] - previous[key] for key in actual}
+
+
+def _reconcile_once() -> None:
+    db = SessionLocal()
+    try:
+        drift = reconcile_stats(db)
+        db.commit()
+        if any(drift.values()):
+            logger.warning(f"Contact stats drift corrected: {drift}")
+    finally:
+        db.close()
+
+
+async def run_reconciliation(interval: float) -> None:
+    """Periodically reconcile the counter row; runs until cancelled."""
+    while True:
+        try:
+            await run_in_threadpool(_reconcile_once)
+        except Exception as e:
+            logger.error(f"Contact stats reconciliation failed: {e}")
+        await asyncio.sleep(interval)
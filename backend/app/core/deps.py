@@ -5,8 +5,8 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.principals import Principal, principal_cache
 from app.core.security import decode_access_token
-from app.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
@@ -14,7 +14,8 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 def get_current_user(
     db: Annotated[Session, Depends(get_db)],
     token: Annotated[str, Depends(oauth2_scheme)],
-) -> User:
+) -> Principal:
+    """Resolve the token's user, usually from cache; db is only queried on a miss."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -25,7 +26,10 @@ def get_current_user(
     if user_id is None:
         raise credentials_exception
 
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    try:
+        user = principal_cache.get(int(user_id), db)
+    except ValueError:
+        raise credentials_exception
     if user is None:
         raise credentials_exception
 
@@ -39,8 +43,8 @@ def get_current_user(
 
 
 def get_current_admin(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
+    current_user: Annotated[Principal, Depends(get_current_user)],
+) -> Principal:
     if not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -50,6 +54,6 @@ def get_current_admin(
 
 
 # Type aliases for cleaner route signatures
-CurrentUser = Annotated[User, Depends(get_current_user)]
-CurrentAdmin = Annotated[User, Depends(get_current_admin)]
+CurrentUser = Annotated[Principal, Depends(get_current_user)]
+CurrentAdmin = Annotated[Principal, Depends(get_current_admin)]
 DbSession = Annotated[Session, Depends(get_db)]
@@ -2,6 +2,9 @@
 
 import asyncio
 import logging
+import time
+from contextlib import suppress
+from html import escape
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
@@ -12,6 +15,183 @@ from app.core.config import settings
 logger = logging.getLogger(__name__)
 
 
+def email_configured() -> bool:
+    """SMTP credentials are optional, so local stand-ins like aiosmtpd work."""
+    return bool(settings.SMTP_HOST and (settings.EMAIL_FROM or settings.SMTP_USER))
+
+
+def build_message(
+    to_email: str,
+    subject: str,
+    body_html: str,
+    body_text: str | None = None,
+) -> MIMEMultipart:
+    message = MIMEMultipart("alternative")
+    message["From"] = settings.EMAIL_FROM or settings.SMTP_USER
+    message["To"] = to_email
+    message["Subject"] = subject
+
+    # Plain text version
+    if body_text:
+        message.attach(MIMEText(body_text, "plain"))
+
+    # HTML version
+    message.attach(MIMEText(body_html, "html"))
+    return message
+
+
+def _smtp_options() -> dict:
+    options = {
+        "hostname": settings.SMTP_HOST,
+        "port": settings.SMTP_PORT,
+        "start_tls": settings.SMTP_START_TLS,
+    }
+    if settings.SMTP_USER and settings.smtp_password:
+        options.update(username=settings.SMTP_USER, password=settings.smtp_password)
+    return options
+
+
+class SMTPPool:
+    """
+    Keeps a few authenticated SMTP sessions open between sends.
+
+    A session is checked out per batch and used for every message in it,
+    so the TCP connect, STARTTLS and AUTH cost is paid once per session
+    rather than once per message. Sessions idle for longer than
+    idle_timeout are dropped, since servers close them on their own. A
+    session that disconnects mid-batch is replaced once and the batch
+    carries on.
+    """
+
+    def __init__(self, size: int, idle_timeout: float):
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self._idle: list[tuple[float, aiosmtplib.SMTP]] = []
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        self.hits = 0
+        self.misses = 0
+        self.reconnects = 0
+        self.sent = 0
+        self.failed = 0
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Sessions belong to the loop that opened them (see send_contact_notification_sync)
+            self._loop = loop
+            self._idle.clear()
+            self._semaphore = asyncio.Semaphore(self.size)
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        smtp = aiosmtplib.SMTP(**_smtp_options())
+        await smtp.connect()
+        return smtp
+
+    async def _checkout(self) -> aiosmtplib.SMTP:
+        while self._idle:
+            returned_at, smtp = self._idle.pop()
+            if smtp.is_connected and time.monotonic() - returned_at < self.idle_timeout:
+                self.hits += 1
+                return smtp
+            await self._discard(smtp)
+
+        self.misses += 1
+        return await self._connect()
+
+    def _checkin(self, smtp: aiosmtplib.SMTP) -> None:
+        if smtp.is_connected and len(self._idle) < self.size:
+            self._idle.append((time.monotonic(), smtp))
+        else:
+            smtp.close()
+
+    @staticmethod
+    async def _discard(smtp: aiosmtplib.SMTP) -> None:
+        try:
+            await smtp.quit()
+        except Exception:
+            smtp.close()
+
+    async def send(self, messages: list[MIMEMultipart]) -> list[Exception | None]:
+        """
+        Send messages over one pooled session.
+
+        Returns:
+            One entry per message: None if it was accepted, else the error
+        """
+        self._bind_loop()
+        async with self._semaphore:
+            try:
+                smtp = await self._checkout()
+            except Exception as e:
+                self.failed += len(messages)
+                return [e] * len(messages)
+
+            results: list[Exception | None] = []
+            reconnected = False
+            try:
+                while len(results) < len(messages):
+                    try:
+                        await smtp.send_message(messages[len(results)])
+                        results.append(None)
+                    except aiosmtplib.SMTPServerDisconnected as e:
+                        if reconnected:
+                            results.extend([e] * (len(messages) - len(results)))
+                            break
+                        reconnected = True
+                        self.reconnects += 1
+                        smtp.close()
+                        try:
+                            smtp = await self._connect()
+                        except Exception as connect_error:
+                            results.extend([connect_error] * (len(messages) - len(results)))
+                            break
+                    except Exception as e:
+                        results.append(e)
+                        # Refused sender or recipients: clear the transaction before the next one
+                        with suppress(Exception):
+                            await smtp.rset()
+            finally:
+                self._checkin(smtp)
+
+        failed = sum(result is not None for result in results)
+        self.sent += len(results) - failed
+        self.failed += failed
+        return results
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for _, smtp in idle:
+            await self._discard(smtp)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "idle": len(self._idle),
+            "hits": self.hits,
+            "misses": self.misses,
+            "reconnects": self.reconnects,
+            "sent": self.sent,
+            "failed": self.failed,
+        }
+
+
+smtp_pool = SMTPPool(
+    size=settings.SMTP_POOL_SIZE,
+    idle_timeout=settings.SMTP_POOL_IDLE_SECONDS,
+)
+
+
+async def send_messages(messages: list[MIMEMultipart]) -> list[Exception | None]:
+    """
+    Send several messages over a single pooled SMTP session.
+
+    Returns:
+        One entry per message: None if it was accepted, else the error
+    """
+    return await smtp_pool.send(messages)
+
+
 async def send_email(
     to_email: str,
     subject: str,
@@ -30,31 +210,15 @@ async def send_email(
     Returns:
         True if email was sent successfully, False otherwise
     """
-    if not all([settings.SMTP_HOST, settings.SMTP_USER, settings.smtp_password]):
+    if not email_configured():
         logger.warning("Email not configured. Skipping email send.")
         return False
 
     try:
-        message = MIMEMultipart("alternative")
-        message["From"] = settings.EMAIL_FROM or settings.SMTP_USER
-        message["To"] = to_email
-        message["Subject"] = subject
-
-        # Plain text version
-        if body_text:
-            message.attach(MIMEText(body_text, "plain"))
-
-        # HTML version
-        message.attach(MIMEText(body_html, "html"))
-
-        await aiosmtplib.send(
-            message,
-            hostname=settings.SMTP_HOST,
-            port=settings.SMTP_PORT,
-            username=settings.SMTP_USER,
-            password=settings.smtp_password,
-            start_tls=True,
-        )
+        message = build_message(to_email, subject, body_html, body_text)
+        [error] = await smtp_pool.send([message])
+        if error is not None:
+            raise error
 
         logger.info(f"Email sent successfully to {to_email}")
         return True
@@ -64,28 +228,32 @@ async def send_email(
         return False
 
 
-async def send_contact_notification(
+NOTIFICATION_STYLES = """
+            body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+            .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+            .header { background: #0f172a; color: white; padding: 20px; border-radius: 8px 8px 0 0; }
+            .content { background: #f8fafc; padding: 20px; border: 1px solid #e2e8f0; }
+            .field { margin-bottom: 15px; }
+            .label { font-weight: bold; color: #64748b; font-size: 12px; text-transform: uppercase; }
+            .value { margin-top: 5px; padding: 10px; background: white; border-radius: 4px; }
+            .message { white-space: pre-wrap; }
+            .submission { padding-bottom: 10px; margin-bottom: 20px; border-bottom: 1px solid #e2e8f0; }
+            .footer { padding: 15px; text-align: center; color: #64748b; font-size: 12px; }
+        """
+
+
+def render_contact_notification(
     first_name: str,
     last_name: str | None,
     email: str,
     message: str,
-) -> bool:
+) -> tuple[str, str, str]:
     """
-    Send notification email when someone submits the contact form.
-
-    Args:
-        first_name: Sender's first name
-        last_name: Sender's last name (optional)
-        email: Sender's email address
-        message: Contact form message
+    Render the contact form notification.
 
     Returns:
-        True if notification was sent successfully
+        (subject, body_html, body_text)
     """
-    if not settings.NOTIFICATION_EMAIL:
-        logger.warning("NOTIFICATION_EMAIL not configured. Skipping notification.")
-        return False
-
     full_name = f"{first_name} {last_name}".strip() if last_name else first_name
 
     subject = f"New Contact Form Submission from {full_name}"
@@ -94,17 +262,7 @@ async def send_contact_notification(
     <!DOCTYPE html>
     <html>
     <head>
-        <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-            .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-            .header {{ background: #0f172a; color: white; padding: 20px; border-radius: 8px 8px 0 0; }}
-            .content {{ background: #f8fafc; padding: 20px; border: 1px solid #e2e8f0; }}
-            .field {{ margin-bottom: 15px; }}
-            .label {{ font-weight: bold; color: #64748b; font-size: 12px; text-transform: uppercase; }}
-            .value {{ margin-top: 5px; padding: 10px; background: white; border-radius: 4px; }}
-            .message {{ white-space: pre-wrap; }}
-            .footer {{ padding: 15px; text-align: center; color: #64748b; font-size: 12px; }}
-        </style>
+        <style>{NOTIFICATION_STYLES}</style>
     </head>
     <body>
         <div class="container">
@@ -114,15 +272,15 @@ async def send_contact_notification(
             <div class="content">
                 <div class="field">
                     <div class="label">Name</div>
-                    <div class="value">{full_name}</div>
+                    <div class="value">{escape(full_name)}</div>
                 </div>
                 <div class="field">
                     <div class="label">Email</div>
-                    <div class="value"><a href="mailto:{email}">{email}</a></div>
+                    <div class="value"><a href="mailto:{escape(email)}">{escape(email)}</a></div>
                 </div>
                 <div class="field">
                     <div class="label">Message</div>
-                    <div class="value message">{message}</div>
+                    <div class="value message">{escape(message)}</div>
                 </div>
             </div>
             <div class="footer">
@@ -146,6 +304,109 @@ Message:
 This email was sent from your portfolio contact form.
     """
 
+    return subject, body_html, body_text
+
+
+def render_contact_digest(submissions: list[dict]) -> tuple[str, str, str]:
+    """
+    Render one notification listing several contact form submissions.
+
+    Args:
+        submissions: Dicts with first_name, last_name, email, message and
+            optionally submitted_at (ISO 8601)
+
+    Returns:
+        (subject, body_html, body_text)
+    """
+    subject = f"{len(submissions)} New Contact Form Submissions"
+
+    sections_html = []
+    sections_text = []
+    for submission in submissions:
+        last_name = submission.get("last_name")
+        full_name = f"{submission['first_name']} {last_name}".strip() if last_name else submission["first_name"]
+        submitted_at = submission.get("submitted_at") or ""
+        email = submission["email"]
+
+        sections_html.append(f"""
+                <div class="submission">
+                    <div class="field">
+                        <div class="label">Name</div>
+                        <div class="value">{escape(full_name)} <span style="color: #64748b;">{escape(submitted_at)}</span></div>
+                    </div>
+                    <div class="field">
+                        <div class="label">Email</div>
+                        <div class="value"><a href="mailto:{escape(email)}">{escape(email)}</a></div>
+                    </div>
+                    <div class="field">
+                        <div class="label">Message</div>
+                        <div class="value message">{escape(submission["message"])}</div>
+                    </div>
+                </div>""")
+        sections_text.append(f"""
+Name: {full_name} {submitted_at}
+Email: {email}
+
+Message:
+{submission["message"]}
+""")
+
+    body_html = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <style>{NOTIFICATION_STYLES}</style>
+    </head>
+    <body>
+        <div class="container">
+            <div class="header">
+                <h2 style="margin: 0;">{subject}</h2>
+            </div>
+            <div class="content">{"".join(sections_html)}
+            </div>
+            <div class="footer">
+                This email was sent from your portfolio contact form.
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+
+    body_text = f"""
+{subject}
+{"---".join(sections_text)}
+---
+This email was sent from your portfolio contact form.
+    """
+
+    return subject, body_html, body_text
+
+
+async def send_contact_notification(
+    first_name: str,
+    last_name: str | None,
+    email: str,
+    message: str,
+) -> bool:
+    """
+    Send notification email when someone submits the contact form.
+
+    Args:
+        first_name: Sender's first name
+        last_name: Sender's last name (optional)
+        email: Sender's email address
+        message: Contact form message
+
+    Returns:
+        True if notification was sent successfully
+    """
+    if not settings.NOTIFICATION_EMAIL:
+        logger.warning("NOTIFICATION_EMAIL not configured. Skipping notification.")
+        return False
+
+    subject, body_html, body_text = render_contact_notification(
+        first_name, last_name, email, message
+    )
     return await send_email(
         to_email=settings.NOTIFICATION_EMAIL,
         subject=subject,
@@ -0,0 +1,65 @@
+"""Helpers for ETag based conditional responses."""
+
+import hashlib
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts) -> str:
+    """Build a strong ETag from the values that identify a representation."""
+    digest = hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches etag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    candidates = [value.strip() for value in header.split(",")]
+    if "*" in candidates:
+        return True
+
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored
+    return any(value.removeprefix("W/") == etag for value in candidates)
+
+
+def accepted_encodings(request: Request) -> set[str]:
+    """Content codings the client accepts, honoring q-values (q=0 means refused)."""
+    accepted = set()
+    for part in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = part.partition(";")
+        quality = 1.0
+        params = params.strip().replace(" ", "")
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if quality > 0:
+            accepted.add(name.strip().lower())
+    accepted.discard("")
+    return accepted
+
+
+def encoded_etag(etag: str, encoding: str | None) -> str:
+    """ETag for an encoded variant, so it never validates against another representation."""
+    if not encoding:
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
+
+
+def json_response(body: bytes, etag: str, headers: dict[str, str] | None = None) -> Response:
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "no-cache", **(headers or {})},
+    )
@@ -0,0 +1,125 @@
+"""Contact inbox events, published with NOTIFY and fanned out to SSE subscribers."""
+
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import psycopg
+from sqlalchemy import Connection, func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CONTACT_CHANNEL = "contact_events"
+AUTH_CHANNEL = "auth_events"
+
+# Sent to subscribers when events may have been missed and they should refetch
+RESYNC = ("resync", "{}")
+
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+def notify(db: Session | Connection, channel: str, event: str, **data) -> None:
+    """Queue a NOTIFY on the caller's transaction; Postgres delivers it on commit only."""
+    payload = json.dumps({"event": event, **data}, default=str)
+    db.execute(select(func.pg_notify(channel, payload)))
+
+
+def publish_contact_event(db: Session, event: str, **data) -> None:
+    notify(db, CONTACT_CHANNEL, event, **data)
+
+
+class EventHub:
+    """
+    Fans notifications from one Postgres channel out to in-process subscribers.
+
+    Each worker holds a single LISTEN connection, opened when the first
+    subscriber arrives, however many subscribers there are. If the
+    connection drops it is re-established with backoff, and subscribers are
+    told to resync since notifications sent meanwhile are lost. A subscriber
+    too slow to drain its queue gets a resync in place of the backlog.
+    """
+
+    def __init__(self, channel: str, conninfo: str):
+        self.channel = channel
+        self.conninfo = conninfo
+        self._subscribers: set[asyncio.Queue] = set()
+        self._listener: asyncio.Task | None = None
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue]:
+        """Yield a queue of (event, payload) tuples until the block exits."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+
+    def _publish(self, event: tuple[str, str]) -> None:
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(RESYNC)
+
+    def _dispatch(self, payload: str) -> None:
+        try:
+            event = json.loads(payload).get("event", "message")
+        except (ValueError, AttributeError):
+            logger.warning(f"Ignoring malformed {self.channel} payload: {payload[:200]}")
+            return
+        self._publish((event, payload))
+
+    async def _listen(self) -> None:
+        delay = 1
+        connected_before = False
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    self.conninfo, autocommit=True
+                ) as conn:
+                    await conn.execute(f"LISTEN {self.channel}")
+                    if connected_before:
+                        self._publish(RESYNC)
+                    connected_before = True
+                    delay = 1
+
+                    async for notify in conn.notifies():
+                        self._dispatch(notify.payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"LISTEN {self.channel} connection lost, retrying in {delay}s: {e}")
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30)
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener = None
+
+
+# psycopg wants a plain libpq URL, without SQLAlchemy's driver suffix
+_conninfo = (
+    make_url(settings.DATABASE_URL)
+    .set(drivername="postgresql")
+    .render_as_string(hide_password=False)
+)
+
+contact_events = EventHub(channel=CONTACT_CHANNEL, conninfo=_conninfo)
+auth_events = EventHub(channel=AUTH_CHANNEL, conninfo=_conninfo)
@@ -0,0 +1,165 @@
+"""Width-bucketed, recompressed derivatives of images under the static mount."""
+
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+
+from app.core.config import settings
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow is optional; originals are served without it
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+STATIC_DIR = Path(__file__).resolve().parent.parent.parent / "static"
+STATIC_URL_PREFIX = "/static/"
+
+IMAGE_WIDTHS = (320, 640, 1280)
+IMAGE_FORMATS = {
+    "webp": ("WEBP", "image/webp"),
+    "jpeg": ("JPEG", "image/jpeg"),
+}
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp", ".tiff"}
+
+TEMP_SUFFIX = ".tmp"
+STALE_TEMP_SECONDS = 3600
+
+
+def derivatives_available() -> bool:
+    return Image is not None
+
+
+def resolve_source(relative_path: str) -> Path | None:
+    """Map a path relative to the static mount to an image file, refusing traversal."""
+    source = (STATIC_DIR / relative_path).resolve()
+    if not source.is_relative_to(STATIC_DIR.resolve()):
+        return None
+    if source.suffix.lower() not in IMAGE_EXTENSIONS or not source.is_file():
+        return None
+    return source
+
+
+def image_srcset(url: str) -> dict[str, str]:
+    """
+    Build srcset strings for an image URL, one per derivative format.
+
+    Only images served from the static mount have derivatives; any other
+    URL gets an empty map and clients fall back to the original.
+
+    Returns:
+        Format name to srcset string, e.g. {"webp": ".../320/a.png?format=webp 320w, ..."}
+    """
+    parts = urlsplit(url)
+    if not parts.path.startswith(STATIC_URL_PREFIX):
+        return {}
+
+    relative_path = parts.path[len(STATIC_URL_PREFIX):]
+    if Path(relative_path).suffix.lower() not in IMAGE_EXTENSIONS:
+        return {}
+
+    srcset = {}
+    for fmt in IMAGE_FORMATS:
+        candidates = []
+        for width in IMAGE_WIDTHS:
+            path = f"{settings.API_V1_PREFIX}/images/{width}/{relative_path}"
+            candidates.append(
+                f"{urlunsplit((parts.scheme, parts.netloc, path, f'format={fmt}', ''))} {width}w"
+            )
+        srcset[fmt] = ", ".join(candidates)
+    return srcset
+
+
+class DerivativeCache:
+    """
+    On-disk cache of generated derivatives, bounded by total size.
+
+    Files are named after the source path, its mtime, width and format, so
+    replacing a source image naturally orphans its old derivatives. Hits
+    touch the file's mtime and eviction removes the least recently used.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: int | None = None
+
+    def _path_for(self, source: Path, width: int, fmt: str) -> Path:
+        relative = source.relative_to(STATIC_DIR.resolve())
+        stem = "__".join(relative.with_suffix("").parts)
+        return self.directory / f"{stem}.{source.stat().st_mtime_ns}.{width}.{fmt}"
+
+    def get(self, source: Path, width: int, fmt: str) -> Path:
+        """Return the derivative for source, generating it on first request."""
+        path = self._path_for(source, width, fmt)
+        if path.exists():
+            os.utime(path)
+            return path
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        pil_format, _ = IMAGE_FORMATS[fmt]
+
+        with Image.open(source) as image:
+            image = ImageOps.exif_transpose(image)
+            if image.width > width:
+                height = round(image.height * width / image.width)
+                image = image.resize((width, height), Image.Resampling.LANCZOS)
+            if pil_format == "JPEG" and image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+
+            # Write then rename, so concurrent readers never see a partial file
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=TEMP_SUFFIX)
+            with os.fdopen(fd, "wb") as tmp:
+                image.save(tmp, pil_format, quality=settings.IMAGE_QUALITY, optimize=True)
+            os.replace(tmp_name, path)
+
+        self._track(path.stat().st_size)
+        return path
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        now = time.time()
+        for f in self.directory.iterdir():
+            try:
+                stat = f.stat()
+            except FileNotFoundError:  # renamed or evicted concurrently
+                continue
+
+            # Temp files may still be written by a request that hasn't renamed
+            # them yet; only ones left behind by a crash are removed
+            if f.suffix == TEMP_SUFFIX:
+                if now - stat.st_mtime > STALE_TEMP_SECONDS:
+                    f.unlink(missing_ok=True)
+                continue
+            entries.append((stat.st_mtime, stat.st_size, f))
+        return entries
+
+    def _track(self, added: int) -> None:
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._entries())
+            else:
+                self._total_bytes += added
+
+            if self._total_bytes <= self.max_bytes:
+                return
+
+            for _, size, f in sorted(self._entries()):
+                if self._total_bytes <= self.max_bytes * 0.9:
+                    break
+                f.unlink(missing_ok=True)
+                self._total_bytes -= size
+
+            logger.info(f"Evicted image derivatives, cache now {self._total_bytes} bytes")
+
+
+derivative_cache = DerivativeCache(
+    directory=Path(settings.IMAGE_CACHE_DIR),
+    max_bytes=settings.IMAGE_CACHE_MAX_BYTES,
+)
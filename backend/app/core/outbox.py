@@ -0,0 +1,376 @@
+"""Transactional email outbox and the background dispatcher that drains it."""
+
+import asyncio
+import logging
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, NamedTuple
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.bulk import bulk_update
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.email import (
+    build_message,
+    email_configured,
+    render_contact_digest,
+    render_contact_notification,
+    send_messages,
+)
+from app.models.contact import ContactSubmission
+from app.models.outbox import OUTBOX_FAILED, OUTBOX_PENDING, OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+CONTACT_NOTIFICATION = "contact_notification"
+
+
+def _render_contact_notification(payload: dict[str, Any]) -> tuple[str, str, str, str]:
+    subject, body_html, body_text = render_contact_notification(
+        payload["first_name"], payload["last_name"], payload["email"], payload["message"]
+    )
+    return settings.NOTIFICATION_EMAIL, subject, body_html, body_text
+
+
+def _render_contact_digest(payloads: list[dict[str, Any]]) -> tuple[str, str, str, str]:
+    subject, body_html, body_text = render_contact_digest(payloads)
+    return settings.NOTIFICATION_EMAIL, subject, body_html, body_text
+
+
+# kind -> payload renderer returning (to_email, subject, body_html, body_text)
+RENDERERS: dict[str, Callable[[dict[str, Any]], tuple[str, str, str, str]]] = {
+    CONTACT_NOTIFICATION: _render_contact_notification,
+}
+
+# kind -> renderer for several payloads coalesced into one email, used in digest mode
+DIGEST_RENDERERS: dict[str, Callable[[list[dict[str, Any]]], tuple[str, str, str, str]]] = {
+    CONTACT_NOTIFICATION: _render_contact_digest,
+}
+
+
+def digests_enabled() -> bool:
+    return settings.NOTIFICATION_DIGEST_ENABLED
+
+
+def enqueue(
+    db: Session,
+    kind: str,
+    payload: dict[str, Any],
+    send_at: Any = None,
+) -> OutboxMessage:
+    """
+    Add a message to the outbox; it is sent once the caller commits.
+
+    Args:
+        db: Database session
+        kind: Renderer key, see RENDERERS
+        payload: JSON-serializable renderer input
+        send_at: Earliest send time (datetime or SQL expression), default now
+    """
+    message = OutboxMessage(kind=kind, payload=payload)
+    if send_at is not None:
+        message.next_attempt_at = send_at
+    db.add(message)
+    return message
+
+
+def _digest_send_at(db: Session) -> Any:
+    """
+    Pick when a new contact notification goes out in digest mode.
+
+    The first submission after NOTIFICATION_DIGEST_QUIET_SECONDS of silence
+    is sent right away. Later ones join the held digest and go out when its
+    window closes, or immediately once it reaches
+    NOTIFICATION_DIGEST_MAX_MESSAGES.
+
+    Returns:
+        None to send now, else a SQL expression for the send time
+    """
+    quiet_since = func.now() - timedelta(seconds=settings.NOTIFICATION_DIGEST_QUIET_SECONDS)
+    # now() is the transaction start, so this skips the submission being added
+    recent = db.scalar(
+        select(func.max(ContactSubmission.created_at) >= quiet_since)
+        .where(ContactSubmission.created_at < func.now())
+    )
+    if not recent:
+        return None
+
+    held_filter = (
+        OutboxMessage.kind == CONTACT_NOTIFICATION,
+        OutboxMessage.status == OUTBOX_PENDING,
+        OutboxMessage.attempts == 0,
+        OutboxMessage.next_attempt_at > func.now(),
+    )
+    held, window_closes_at = db.execute(
+        select(func.count(), func.min(OutboxMessage.next_attempt_at)).where(*held_filter)
+    ).one()
+
+    if held + 1 >= settings.NOTIFICATION_DIGEST_MAX_MESSAGES:
+        db.execute(
+            update(OutboxMessage)
+            .where(*held_filter)
+            .values(next_attempt_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        return None
+
+    return window_closes_at or func.now() + timedelta(
+        seconds=settings.NOTIFICATION_DIGEST_WINDOW_SECONDS
+    )
+
+
+def enqueue_contact_notification(db: Session, submission: ContactSubmission) -> None:
+    if not settings.NOTIFICATION_EMAIL:
+        logger.warning("NOTIFICATION_EMAIL not configured. Skipping notification.")
+        return
+    # The dispatcher only runs when SMTP is configured; nothing would drain the row
+    if not email_configured():
+        logger.warning("Email not configured. Skipping notification.")
+        return
+
+    enqueue(
+        db,
+        CONTACT_NOTIFICATION,
+        {
+            "first_name": submission.first_name,
+            "last_name": submission.last_name,
+            "email": submission.email,
+            "message": submission.message,
+            "submitted_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        send_at=_digest_send_at(db) if digests_enabled() else None,
+    )
+
+
+def retry_delay(attempts: int) -> float:
+    """Exponential backoff with jitter, capped at OUTBOX_RETRY_MAX_SECONDS."""
+    delay = settings.OUTBOX_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0)
+    return min(delay, settings.OUTBOX_RETRY_MAX_SECONDS) * random.uniform(0.8, 1.2)
+
+
+def retry_failed(db: Session) -> int:
+    """Give failed messages a fresh set of attempts; the caller commits."""
+    return db.execute(
+        update(OutboxMessage)
+        .where(OutboxMessage.status == OUTBOX_FAILED)
+        .values(status=OUTBOX_PENDING, attempts=0, next_attempt_at=func.now())
+        .execution_options(synchronize_session=False)
+    ).rowcount
+
+
+def queue_depth(db: Session) -> dict[str, Any]:
+    """Count pending, due and failed messages and the age of the oldest pending one."""
+    pending = OutboxMessage.status == OUTBOX_PENDING
+    row = db.execute(
+        select(
+            func.count().filter(pending),
+            func.count().filter(pending, OutboxMessage.next_attempt_at <= func.now()),
+            func.count().filter(OutboxMessage.status == OUTBOX_FAILED),
+            func.min(OutboxMessage.created_at).filter(pending),
+        )
+    ).one()
+
+    oldest = row[3]
+    return {
+        "pending": row[0],
+        "due": row[1],
+        "failed": row[2],
+        "oldest_pending_seconds": (
+            (datetime.now(timezone.utc) - oldest).total_seconds() if oldest else None
+        ),
+    }
+
+
+class ClaimedMessage(NamedTuple):
+    id: int
+    kind: str
+    payload: dict[str, Any]
+    attempts: int
+
+
+class _Failure(NamedTuple):
+    id: int
+    status: str
+    next_attempt_at: datetime
+    last_error: str
+
+
+class OutboxDispatcher:
+    """
+    Sends outbox messages in batches from a background task.
+
+    A batch is claimed with FOR UPDATE SKIP LOCKED, so several workers can
+    dispatch concurrently without sending a message twice. Claiming pushes
+    next_attempt_at out by a lease instead of holding the row lock while
+    SMTP runs; if the process dies mid-send, the rows become due again when
+    the lease expires.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        poll_interval: float,
+        lease_seconds: float,
+        max_attempts: int,
+    ):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._wakeup = asyncio.Event()
+
+    def wake(self) -> None:
+        """Start the next batch now rather than at the next poll; call from the event loop."""
+        self._wakeup.set()
+
+    def _claim(self) -> list[ClaimedMessage]:
+        due = (
+            select(OutboxMessage.id)
+            .where(
+                OutboxMessage.status == OUTBOX_PENDING,
+                OutboxMessage.next_attempt_at <= func.now(),
+            )
+            .order_by(OutboxMessage.next_attempt_at, OutboxMessage.id)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(due))
+            .values(
+                attempts=OutboxMessage.attempts + 1,
+                next_attempt_at=func.now() + timedelta(seconds=self.lease_seconds),
+            )
+            .returning(
+                OutboxMessage.id,
+                OutboxMessage.kind,
+                OutboxMessage.payload,
+                OutboxMessage.attempts,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        db = SessionLocal()
+        try:
+            claimed = [ClaimedMessage(*row) for row in db.execute(stmt).all()]
+            db.commit()
+            return claimed
+        finally:
+            db.close()
+
+    def _finish(self, sent: list[int], failed: list[tuple[ClaimedMessage, str]]) -> None:
+        now = datetime.now(timezone.utc)
+        failures = [
+            _Failure(
+                id=message.id,
+                status=OUTBOX_FAILED if message.attempts >= self.max_attempts else OUTBOX_PENDING,
+                next_attempt_at=now + timedelta(seconds=retry_delay(message.attempts)),
+                last_error=error[:1000],
+            )
+            for message, error in failed
+        ]
+
+        db = SessionLocal()
+        try:
+            if sent:
+                db.execute(delete(OutboxMessage).where(OutboxMessage.id.in_(sent)))
+            if failures:
+                bulk_update(
+                    db,
+                    OutboxMessage,
+                    failures,
+                    fields=("status", "next_attempt_at", "last_error"),
+                )
+            db.commit()
+        finally:
+            db.close()
+
+    @staticmethod
+    def _group(claimed: list[ClaimedMessage]) -> list[list[ClaimedMessage]]:
+        """Split a batch into one group per email, coalescing digestible kinds in digest mode."""
+        groups = []
+        digestible: dict[str, list[ClaimedMessage]] = {}
+        for message in claimed:
+            if digests_enabled() and message.kind in DIGEST_RENDERERS:
+                digestible.setdefault(message.kind, []).append(message)
+            else:
+                groups.append([message])
+
+        size = max(settings.NOTIFICATION_DIGEST_MAX_MESSAGES, 1)
+        for messages in digestible.values():
+            groups.extend(messages[i:i + size] for i in range(0, len(messages), size))
+        return groups
+
+    @staticmethod
+    def _render(group: list[ClaimedMessage]):
+        kind = group[0].kind
+        if len(group) == 1:
+            return build_message(*RENDERERS[kind](group[0].payload))
+        return build_message(*DIGEST_RENDERERS[kind]([message.payload for message in group]))
+
+    async def dispatch_once(self) -> int:
+        """
+        Claim and send one batch.
+
+        Returns:
+            Number of messages claimed
+        """
+        claimed = await run_in_threadpool(self._claim)
+        if not claimed:
+            return 0
+
+        failed: list[tuple[ClaimedMessage, str]] = []
+        ready: list[list[ClaimedMessage]] = []
+        emails = []
+        for group in self._group(claimed):
+            try:
+                emails.append(self._render(group))
+                ready.append(group)
+            except Exception as e:
+                failed.extend((message, f"Could not render {message.kind}: {e!r}") for message in group)
+
+        sent = []
+        results = await send_messages(emails) if emails else []
+        for group, error in zip(ready, results):
+            if error is None:
+                sent.extend(message.id for message in group)
+            else:
+                failed.extend((message, repr(error)) for message in group)
+
+        await run_in_threadpool(self._finish, sent, failed)
+
+        if failed:
+            logger.warning(f"Outbox batch: {len(sent)} sent, {len(failed)} failed")
+        else:
+            logger.info(f"Outbox batch: {len(sent)} sent")
+        return len(claimed)
+
+    async def run(self) -> None:
+        """Dispatch until cancelled, waking on wake() or every poll_interval."""
+        while True:
+            self._wakeup.clear()
+            try:
+                claimed = await self.dispatch_once()
+            except Exception as e:
+                logger.error(f"Outbox dispatch failed: {e}")
+                claimed = 0
+
+            # A full batch suggests more is waiting
+            if claimed >= self.batch_size:
+                continue
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+outbox_dispatcher = OutboxDispatcher(
+    batch_size=settings.OUTBOX_BATCH_SIZE,
+    poll_interval=settings.OUTBOX_POLL_SECONDS,
+    lease_seconds=settings.OUTBOX_LEASE_SECONDS,
+    max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+)
@@ -0,0 +1,228 @@
+"""Monthly range partitions for contact_submissions: creation ahead of time and archival."""
+
+import asyncio
+import logging
+import re
+from datetime import date, datetime, timezone
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import Connection, text
+
+from app.core.config import settings
+from app.core.contact_stats import counters_enabled, reconcile_stats
+from app.core.database import SessionLocal, engine
+from app.models.contact import ContactSubmission
+
+logger = logging.getLogger(__name__)
+
+TABLE = ContactSubmission.__tablename__
+DEFAULT_PARTITION = f"{TABLE}_default"
+ARCHIVE_PREFIX = "archived_"
+
+_MONTH_PARTITION = re.compile(rf"^{TABLE}_y(?P<year>\d{{4}})m(?P<month>\d{{2}})$")
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{TABLE}_y{month.year:04d}m{month.month:02d}"
+
+
+def is_partitioned(conn: Connection) -> bool | None:
+    """
+    Report how contact_submissions exists in the database.
+
+    Returns:
+        True if partitioned, False if a plain table, None if missing
+    """
+    kind = conn.execute(
+        text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": TABLE},
+    ).scalar()
+    if kind is None:
+        return None
+    return kind == "p"
+
+
+def _month_partitions(conn: Connection) -> list[tuple[str, date]]:
+    names = conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(:table)"
+        ),
+        {"table": TABLE},
+    ).scalars()
+
+    partitions = []
+    for name in names:
+        match = _MONTH_PARTITION.match(name)
+        if match:
+            partitions.append((name, date(int(match["year"]), int(match["month"]), 1)))
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def create_partition(conn: Connection, month: date) -> None:
+    """Create the partition for a calendar month (UTC bounds) if it does not exist."""
+    start, end = month, _add_months(month, 1)
+    conn.execute(text(
+        f'CREATE TABLE IF NOT EXISTS "{partition_name(month)}" PARTITION OF "{TABLE}" '
+        f"FOR VALUES FROM ('{start.isoformat()} 00:00:00+00') TO ('{end.isoformat()} 00:00:00+00')"
+    ))
+
+
+def ensure_partitions(conn: Connection, months_ahead: int) -> None:
+    """
+    Make sure the current month and the next months_ahead have partitions.
+
+    A default partition catches rows outside every monthly range, such as
+    imported submissions from months that were never created.
+    """
+    conn.execute(text(f'CREATE TABLE IF NOT EXISTS "{DEFAULT_PARTITION}" PARTITION OF "{TABLE}" DEFAULT'))
+
+    this_month = datetime.now(timezone.utc).date().replace(day=1)
+    for offset in range(months_ahead + 1):
+        month = _add_months(this_month, offset)
+        # Fails if the default partition already holds rows for this month
+        try:
+            with conn.begin_nested():
+                create_partition(conn, month)
+        except Exception as e:
+            logger.error(f"Could not create partition {partition_name(month)}: {e}")
+
+
+def archive_old_partitions(conn: Connection, after_months: int) -> list[str]:
+    """
+    Detach monthly partitions older than after_months whose rows are all archived.
+
+    Detached partitions are renamed with an "archived_" prefix and kept as
+    standalone tables, so the data survives but no longer weighs on inbox
+    queries or stats. Partitions still holding unarchived rows are left
+    attached until those rows are archived or deleted.
+
+    Returns:
+        Names of the tables that were detached
+    """
+    cutoff = _add_months(datetime.now(timezone.utc).date().replace(day=1), -after_months)
+
+    detached = []
+    for name, month in _month_partitions(conn):
+        if _add_months(month, 1) > cutoff:
+            break
+
+        unarchived = conn.execute(
+            text(f'SELECT count(*) FROM "{name}" WHERE NOT is_archived')
+        ).scalar()
+        if unarchived:
+            logger.info(f"Keeping partition {name}: {unarchived} submissions not archived")
+            continue
+
+        conn.execute(text(f'ALTER TABLE "{TABLE}" DETACH PARTITION "{name}"'))
+        conn.execute(text(f'ALTER TABLE "{name}" RENAME TO "{ARCHIVE_PREFIX}{name}"'))
+        detached.append(f"{ARCHIVE_PREFIX}{name}")
+
+    return detached
+
+
+def maintain_partitions() -> None:
+    """Create upcoming partitions and detach expired archived ones."""
+    with engine.begin() as conn:
+        if not is_partitioned(conn):
+            return
+        ensure_partitions(conn, settings.CONTACT_PARTITIONS_AHEAD)
+
+    if settings.CONTACT_ARCHIVE_AFTER_MONTHS <= 0:
+        return
+
+    db = SessionLocal()
+    try:
+        detached = archive_old_partitions(db.connection(), settings.CONTACT_ARCHIVE_AFTER_MONTHS)
+        # Detached rows no longer count towards the inbox totals
+        if detached and counters_enabled():
+            reconcile_stats(db)
+        db.commit()
+    finally:
+        db.close()
+
+    if detached:
+        logger.info(f"Detached archived contact partitions: {', '.join(detached)}")
+
+
+def check_partitioning() -> None:
+    """Warn at startup when contact_submissions predates partitioning."""
+    with engine.connect() as conn:
+        if is_partitioned(conn) is False:
+            logger.warning(
+                f"{TABLE} is not partitioned; run scripts/partition_contact_submissions.py "
+                f"to convert it. Partition maintenance is disabled until then."
+            )
+
+
+async def run_partition_maintenance(interval: float) -> None:
+    """Periodically maintain partitions; runs until cancelled."""
+    while True:
+        try:
+            await run_in_threadpool(maintain_partitions)
+        except Exception as e:
+            logger.error(f"Contact partition maintenance failed: {e}")
+        await asyncio.sleep(interval)
+
+
+def convert_to_partitioned(conn: Connection, drop_old: bool = False) -> str:
+    """
+    Rebuild an existing plain contact_submissions table as a partitioned one.
+
+    The old table, its indexes, primary key and id sequence are renamed
+    out of the way, the partitioned table is created from the model with
+    partitions covering every existing month, rows are copied across and
+    the id sequence is carried forward. Run inside a single transaction.
+
+    Args:
+        conn: Connection with an open transaction
+        drop_old: Drop the old table once its rows are copied
+
+    Returns:
+        Name of the old table, or "" if it was dropped
+    """
+    if is_partitioned(conn) is not False:
+        raise RuntimeError(f"{TABLE} is missing or already partitioned")
+
+    old = f"{TABLE}_unpartitioned"
+    conn.execute(text(f'LOCK TABLE "{TABLE}" IN ACCESS EXCLUSIVE MODE'))
+    conn.execute(text(f'ALTER TABLE "{TABLE}" RENAME TO "{old}"'))
+
+    # Index, constraint and sequence names are schema-wide, so move them aside too
+    for (index_name,) in conn.execute(
+        text("SELECT indexname FROM pg_indexes WHERE tablename = :table"), {"table": old}
+    ).all():
+        conn.execute(text(f'ALTER INDEX "{index_name}" RENAME TO "{old}_{index_name}"'))
+    sequence = conn.execute(
+        text("SELECT pg_get_serial_sequence(:table, 'id')"), {"table": old}
+    ).scalar()
+    if sequence:
+        conn.execute(text(f"ALTER SEQUENCE {sequence} RENAME TO {old}_id_seq"))
+
+    ContactSubmission.__table__.create(conn)
+    ensure_partitions(conn, settings.CONTACT_PARTITIONS_AHEAD)
+
+    first, last = conn.execute(text(f'SELECT min(created_at), max(created_at) FROM "{old}"')).one()
+    if first is not None:
+        month = first.astimezone(timezone.utc).date().replace(day=1)
+        while month <= last.astimezone(timezone.utc).date():
+            create_partition(conn, month)
+            month = _add_months(month, 1)
+
+    columns = ", ".join(f'"{column.name}"' for column in ContactSubmission.__table__.columns)
+    conn.execute(text(f'INSERT INTO "{TABLE}" ({columns}) SELECT {columns} FROM "{old}"'))
+    conn.execute(text(
+        f"SELECT setval(pg_get_serial_sequence('{TABLE}', 'id'), "
+        f'coalesce((SELECT max(id) FROM "{old}"), 0) + 1, false)'
+    ))
+
+    if drop_old:
+        conn.execute(text(f'DROP TABLE "{old}"'))
+        return ""
+    return old
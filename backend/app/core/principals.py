@@ -0,0 +1,114 @@
+"""Cache of authenticated principals, so token checks skip the users query."""
+
+import json
+import logging
+import threading
+from dataclasses import dataclass
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.core.cache import ResponseCache
+from app.core.config import settings
+from app.core.events import AUTH_CHANNEL, RESYNC, auth_events, notify
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+USER_CHANGED = "user.changed"
+
+# Changes to these invalidate the user's cached principal
+PRINCIPAL_FIELDS = ("is_active", "is_admin")
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """What request authorization needs to know about a user."""
+
+    id: int
+    is_active: bool
+    is_admin: bool
+
+
+class PrincipalCache:
+    """
+    Resolved principals keyed by (user id, version).
+
+    Each user has a version stamp, bumped whenever their is_active or
+    is_admin changes. A lookup reads the version before querying, so a
+    principal loaded while a change is being committed is stored under the
+    old version and never served again. Other workers bump their stamps
+    when the change's NOTIFY arrives; the TTL bounds staleness if that is
+    missed, or if users are changed with raw SQL.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._entries = ResponseCache(maxsize=maxsize, ttl=ttl)
+        self._versions: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def version(self, user_id: int) -> int:
+        return self._versions.get(user_id, 0)
+
+    def get(self, user_id: int, db: Session) -> Principal | None:
+        """Return the user's principal from cache, loading it with db on a miss."""
+        key = (user_id, self.version(user_id))
+        principal = self._entries.get(key)
+        if principal is not None:
+            return principal
+
+        row = db.query(User.id, User.is_active, User.is_admin).filter(User.id == user_id).first()
+        if row is None:
+            return None
+
+        principal = Principal(*row)
+        self._entries.set(key, principal)
+        return principal
+
+    def bump(self, user_id: int) -> None:
+        with self._lock:
+            self._versions[user_id] = self.version(user_id) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._versions.clear()
+            self._entries.clear()
+
+
+principal_cache = PrincipalCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def _user_changed(connection, user_id: int) -> None:
+    principal_cache.bump(user_id)
+    # Delivered on commit, to every worker including this one
+    notify(connection, AUTH_CHANNEL, USER_CHANGED, id=user_id)
+
+
+@event.listens_for(User, "after_update")
+def _invalidate_on_update(mapper, connection, target: User) -> None:
+    state = inspect(target)
+    if any(state.attrs[field].history.has_changes() for field in PRINCIPAL_FIELDS):
+        _user_changed(connection, target.id)
+
+
+@event.listens_for(User, "after_delete")
+def _invalidate_on_delete(mapper, connection, target: User) -> None:
+    _user_changed(connection, target.id)
+
+
+async def run_principal_invalidation() -> None:
+    """Apply user changes committed by other workers; runs until cancelled."""
+    async with auth_events.subscribe() as queue:
+        while True:
+            event_name, payload = await queue.get()
+            if (event_name, payload) == RESYNC:
+                # Changes may have been missed while LISTEN was down
+                principal_cache.clear()
+            elif event_name == USER_CHANGED:
+                try:
+                    principal_cache.bump(int(json.loads(payload)["id"]))
+                except (KeyError, TypeError, ValueError):
+                    logger.warning(f"Ignoring malformed {USER_CHANGED} payload: {payload[:200]}")
@@ -0,0 +1,178 @@
+"""In-process token-bucket rate limiting."""
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import OAuth2PasswordRequestForm
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucketLimiter:
+    """
+    Token buckets keyed by an arbitrary string (usually a client IP).
+
+    Each key holds up to `burst` tokens, refilled at `rate` tokens per
+    second. The key table is an LRU capped at `max_keys`, so a flood of
+    spoofed addresses evicts the oldest buckets rather than growing memory.
+    An evicted key starts over with a full bucket, which is why callers
+    should pair this with a global limiter.
+    """
+
+    def __init__(self, rate: float, burst: int, max_keys: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _tokens(self, key: str, now: float) -> float:
+        tokens, updated_at = self._buckets.get(key, (self.burst, now))
+        return min(self.burst, tokens + (now - updated_at) * self.rate)
+
+    def _retry_after(self, tokens: float) -> float:
+        return (1 - tokens) / self.rate if self.rate > 0 else math.inf
+
+    def _store(self, key: str, tokens: float, now: float) -> None:
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+
+    def hit(self, key: str = "") -> float:
+        """
+        Take one token for key.
+
+        Returns:
+            0 if the request is allowed, otherwise seconds until a token frees up
+        """
+        return hit_all((self, key))
+
+    def reset(self, key: str = "") -> None:
+        with self._lock:
+            self._buckets.pop(key, None)
+
+
+def hit_all(*checks: tuple[TokenBucketLimiter, str]) -> float:
+    """
+    Take a token from every (limiter, key) pair, or from none of them.
+
+    A request rejected by one limiter does not drain the others, so a
+    client blocked by the global limit keeps its own allowance.
+
+    Returns:
+        0 if allowed, otherwise the longest wait among the exhausted limiters
+    """
+    limiters = sorted({id(limiter): limiter for limiter, _ in checks}.values(), key=id)
+    for limiter in limiters:
+        limiter._lock.acquire()
+    try:
+        now = time.monotonic()
+        pending = [(limiter, key, limiter._tokens(key, now)) for limiter, key in checks]
+        wait = max(
+            (limiter._retry_after(tokens) for limiter, _, tokens in pending if tokens < 1),
+            default=0,
+        )
+        if wait:
+            return wait
+        for limiter, key, tokens in pending:
+            limiter._store(key, tokens - 1, now)
+        return 0
+    finally:
+        for limiter in reversed(limiters):
+            limiter._lock.release()
+
+
+def client_ip(request: Request) -> str | None:
+    """
+    Best-effort client address, honoring X-Forwarded-For from trusted proxies.
+
+    Each of the TRUSTED_PROXY_HOPS proxies in front of us appends the
+    address it saw to X-Forwarded-For, so the entry that many places from
+    the right is the client as seen by the outermost proxy. Anything further
+    left is supplied by the client and cannot be trusted.
+    """
+    peer = request.client.host if request.client else None
+    hops = settings.TRUSTED_PROXY_HOPS
+    if hops <= 0:
+        return peer
+
+    forwarded = [
+        entry.strip()
+        for header in request.headers.getlist("x-forwarded-for")
+        for entry in header.split(",")
+        if entry.strip()
+    ]
+    if not forwarded:
+        return peer
+    return forwarded[-min(hops, len(forwarded))]
+
+
+def too_many_requests(retry_after: float) -> HTTPException:
+    # A limiter with a zero rate never refills, so there is no time to advertise
+    headers = None
+    if math.isfinite(retry_after):
+        headers = {"Retry-After": str(max(1, math.ceil(retry_after)))}
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many requests, please try again later",
+        headers=headers,
+    )
+
+
+contact_ip_limiter = TokenBucketLimiter(
+    rate=settings.CONTACT_RATE_LIMIT_PER_HOUR / 3600,
+    burst=settings.CONTACT_RATE_LIMIT_BURST,
+    max_keys=settings.RATE_LIMIT_MAX_KEYS,
+)
+contact_global_limiter = TokenBucketLimiter(
+    rate=settings.CONTACT_GLOBAL_RATE_LIMIT_PER_HOUR / 3600,
+    burst=settings.CONTACT_GLOBAL_RATE_LIMIT_BURST,
+)
+
+
+def limit_contact_submissions(request: Request) -> None:
+    """Reject contact form posts over the per-IP or global limit with a 429."""
+    ip = client_ip(request) or "unknown"
+    retry_after = hit_all((contact_ip_limiter, ip), (contact_global_limiter, ""))
+    if retry_after:
+        logger.warning(f"Contact form rate limit hit for {ip}")
+        raise too_many_requests(retry_after)
+
+
+login_ip_limiter = TokenBucketLimiter(
+    rate=settings.LOGIN_RATE_LIMIT_PER_HOUR / 3600,
+    burst=settings.LOGIN_RATE_LIMIT_BURST,
+    max_keys=settings.RATE_LIMIT_MAX_KEYS,
+)
+login_account_limiter = TokenBucketLimiter(
+    rate=settings.LOGIN_ACCOUNT_RATE_LIMIT_PER_HOUR / 3600,
+    burst=settings.LOGIN_ACCOUNT_RATE_LIMIT_BURST,
+    max_keys=settings.RATE_LIMIT_MAX_KEYS,
+)
+
+
+def login_account_key(username: str) -> str:
+    return username.strip().lower()
+
+
+def limit_login_attempts(
+    request: Request,
+    form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+) -> None:
+    """Reject login attempts over the per-IP or per-account limit with a 429, before hashing."""
+    ip = client_ip(request) or "unknown"
+    retry_after = hit_all(
+        (login_ip_limiter, ip),
+        (login_account_limiter, login_account_key(form_data.username)),
+    )
+    if retry_after:
+        logger.warning(f"Login rate limit hit for {ip}")
+        raise too_many_requests(retry_after)
@@ -0,0 +1,129 @@
+"""Trigram indexes for contact search, built concurrently outside the request path."""
+
+import logging
+
+from sqlalchemy import Connection, Index, text
+from sqlalchemy.schema import CreateIndex
+
+from app.core.database import engine
+from app.core.partitions import TABLE, is_partitioned
+from app.models.contact import SEARCH_INDEXES
+
+logger = logging.getLogger(__name__)
+
+
+def _index_valid(conn: Connection, name: str) -> bool | None:
+    """True if usable, False if left invalid by an unfinished build, None if missing."""
+    return conn.execute(
+        text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+        {"name": name},
+    ).scalar()
+
+
+def missing_search_indexes(conn: Connection) -> list[Index]:
+    return [index for index in SEARCH_INDEXES if not _index_valid(conn, index.name)]
+
+
+def check_search_indexes() -> None:
+    """Warn at startup when contact search would fall back to sequential scans."""
+    with engine.connect() as conn:
+        if is_partitioned(conn) is None:
+            return
+        missing = missing_search_indexes(conn)
+    if missing:
+        logger.warning(
+            f"Contact search indexes missing ({', '.join(index.name for index in missing)}); "
+            f"run scripts/create_contact_search_indexes.py to build them."
+        )
+
+
+def _create_sql(conn: Connection, index: Index, name: str, table: str) -> str:
+    """CREATE INDEX for index with its name and target table swapped out."""
+    preparer = conn.dialect.identifier_preparer
+    ddl = str(CreateIndex(index).compile(dialect=conn.dialect))
+    prefix = f"CREATE INDEX {preparer.quote(index.name)} ON {preparer.format_table(index.table)} "
+    return f"CREATE INDEX {preparer.quote(name)} ON {table} {ddl.removeprefix(prefix)}"
+
+
+def _drop_if_invalid(conn: Connection, name: str) -> None:
+    # A failed concurrent build leaves an invalid index that IF NOT EXISTS would keep
+    if _index_valid(conn, name) is False:
+        logger.info(f"Dropping invalid index {name}")
+        conn.execute(text(f'DROP INDEX CONCURRENTLY "{name}"'))
+
+
+def _create_concurrently(conn: Connection, index: Index, name: str, table: str) -> None:
+    _drop_if_invalid(conn, name)
+    sql = _create_sql(conn, index, name, f'"{table}"')
+    conn.execute(text(sql.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY IF NOT EXISTS", 1)))
+
+
+def _build_partitioned(conn: Connection, index: Index) -> None:
+    """
+    Build an index on the partitioned table without blocking writes.
+
+    CONCURRENTLY is not supported on a partitioned table, so the parent
+    index is created ON ONLY (instant, invalid until complete), each
+    partition is indexed concurrently, and the partition indexes are
+    attached. The parent becomes valid once every partition is attached.
+    """
+    parent = index.name
+    conn.execute(text(
+        _create_sql(conn, index, parent, f'ONLY "{TABLE}"').replace(
+            "CREATE INDEX", "CREATE INDEX IF NOT EXISTS", 1
+        )
+    ))
+
+    partitions = conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(:table) ORDER BY child.relname"
+        ),
+        {"table": TABLE},
+    ).scalars().all()
+    # Partitions created after the parent index got theirs automatically
+    indexed = set(conn.execute(
+        text(
+            "SELECT tbl.relname FROM pg_inherits "
+            "JOIN pg_index ON pg_index.indexrelid = pg_inherits.inhrelid "
+            "JOIN pg_class tbl ON tbl.oid = pg_index.indrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(:index)"
+        ),
+        {"index": parent},
+    ).scalars())
+
+    suffix = parent.removeprefix(f"ix_{TABLE}_")
+    for partition in partitions:
+        if partition in indexed:
+            continue
+        child = f"ix_{partition}_{suffix}"
+        logger.info(f"Building {child}")
+        _create_concurrently(conn, index, child, partition)
+        conn.execute(text(f'ALTER INDEX "{parent}" ATTACH PARTITION "{child}"'))
+
+
+def build_search_indexes() -> list[str]:
+    """
+    Create any missing contact search indexes without locking out writes.
+
+    Safe to re-run after an interruption: finished work is kept and
+    invalid leftovers are rebuilt.
+
+    Returns:
+        Names of the indexes that were built or completed
+    """
+    built = []
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        partitioned = is_partitioned(conn)
+        if partitioned is None:
+            return built
+
+        for index in missing_search_indexes(conn):
+            logger.info(f"Building {index.name}")
+            if partitioned:
+                _build_partitioned(conn, index)
+            else:
+                _create_concurrently(conn, index, index.name, TABLE)
+            built.append(index.name)
+    return built
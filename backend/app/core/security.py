@@ -1,5 +1,12 @@
+import asyncio
+import hashlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, NamedTuple
 
 from jose import jwt, JWTError
 import bcrypt
@@ -17,25 +24,203 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     return bcrypt.hashpw(
         password.encode("utf-8"),
-        bcrypt.gensalt()
+        bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     ).decode("utf-8")
 
 
-def create_access_token(subject: str | Any, expires_delta: timedelta | None = None) -> str:
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True when the hash was made with a bcrypt cost other than BCRYPT_ROUNDS."""
+    try:
+        # $2b$<cost>$<salt and hash>
+        return int(hashed_password.split("$")[2]) != settings.BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when too many hash operations are already queued."""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on its own small thread pool.
+
+    bcrypt takes hundreds of milliseconds per call; on the shared anyio
+    threadpool a few concurrent logins would hold slots that public reads
+    need. bcrypt releases the GIL, so a thread pool gives real parallelism
+    here. At most `workers` hashes run at once and at most `max_pending`
+    are in flight, running or queued; beyond that callers get
+    PasswordHasherBusy straight away rather than queueing without bound.
+    Call from the event loop.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._pending = 0
+
+    async def _run(self, func, *args):
+        if self._pending >= self.max_pending:
+            raise PasswordHasherBusy()
+
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+
+class AccessClaims(NamedTuple):
+    subject: str
+    jti: str
+    expires_at: float
+
+
+def create_access_token(
+    subject: str | Any,
+    expires_delta: timedelta | None = None,
+    jti: str | None = None,
+) -> str:
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
     else:
         expire = datetime.now(timezone.utc) + timedelta(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
-    to_encode = {"exp": expire, "sub": str(subject)}
+    to_encode = {"exp": expire, "sub": str(subject), "jti": jti or uuid.uuid4().hex}
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 
-def decode_access_token(token: str) -> str | None:
+class VerifiedTokenCache:
+    """
+    LRU of tokens whose signature and claims have already been checked.
+
+    Keyed by a SHA-256 digest of the token, so the cache holds no bearer
+    credentials, and each entry is only trusted until the token's exp. Only
+    successful verifications are stored; bad tokens are re-checked each
+    time. Shared by the anyio worker threads, hence the lock.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, AccessClaims] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, key: bytes) -> AccessClaims | None:
+        """Return the verified claims, or None if missing or expired."""
+        with self._lock:
+            claims = self._entries.get(key)
+            if claims is None:
+                return None
+
+            if claims.expires_at <= time.time():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return claims
+
+    def set(self, key: bytes, claims: AccessClaims) -> None:
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = claims
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+verified_tokens = VerifiedTokenCache(maxsize=settings.TOKEN_CACHE_MAX_ENTRIES)
+
+
+class RevokedTokens:
+    """
+    Denylist of access token jtis, each kept only until its token expires.
+
+    Lookups are a single dict read. Access tokens are short-lived, so the
+    list stays small: expired entries are pruned whenever more are added.
+    Other workers learn of revocations through app.core.tokens.
+    """
+
+    def __init__(self):
+        self._jtis: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def is_revoked(self, jti: str) -> bool:
+        expires_at = self._jtis.get(jti)
+        return expires_at is not None and expires_at > time.time()
+
+    def add(self, revoked: dict[str, float]) -> None:
+        """Deny jti -> expires_at (Unix time) pairs until they expire."""
+        now = time.time()
+        with self._lock:
+            live = {jti: exp for jti, exp in self._jtis.items() if exp > now}
+            live.update((jti, exp) for jti, exp in revoked.items() if exp > now)
+            self._jtis = live
+
+    def replace(self, revoked: dict[str, float]) -> None:
+        """Swap in a full denylist, e.g. reloaded from the database."""
+        now = time.time()
+        with self._lock:
+            self._jtis = {jti: exp for jti, exp in revoked.items() if exp > now}
+
+    def __len__(self) -> int:
+        return len(self._jtis)
+
+
+revoked_tokens = RevokedTokens()
+
+
+def decode_access_claims(token: str) -> AccessClaims | None:
+    """Verify a token's signature and expiry, without the denylist check."""
+    key = verified_tokens.key(token)
+    claims = verified_tokens.get(key)
+    if claims is not None:
+        return claims
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload.get("sub")
     except JWTError:
         return None
+
+    # Tokens without a jti can't be revoked, so they are no longer accepted
+    subject, jti, expires_at = payload.get("sub"), payload.get("jti"), payload.get("exp")
+    if not (
+        isinstance(subject, str)
+        and isinstance(jti, str)
+        and isinstance(expires_at, (int, float))
+    ):
+        return None
+
+    claims = AccessClaims(subject=subject, jti=jti, expires_at=expires_at)
+    verified_tokens.set(key, claims)
+    return claims
+
+
+def decode_access_token(token: str) -> str | None:
+    claims = decode_access_claims(token)
+    if claims is None or revoked_tokens.is_revoked(claims.jti):
+        return None
+    return claims.subject
@@ -0,0 +1,215 @@
+"""Refresh token rotation and access token revocation, synced across workers."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import secrets
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.events import AUTH_CHANNEL, RESYNC, auth_events, notify
+from app.core.security import create_access_token, revoked_tokens
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+from app.schemas.user import Token
+
+logger = logging.getLogger(__name__)
+
+TOKENS_REVOKED = "tokens.revoked"
+
+# NOTIFY payloads are capped at 8000 bytes; larger revocations make workers reload
+MAX_NOTIFIED_JTIS = 100
+
+
+class InvalidRefreshToken(Exception):
+    """Raised for unknown, expired, revoked or reused refresh tokens."""
+
+
+def hash_refresh_token(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def issue_tokens(db: Session, user_id: int, family_id: str | None = None) -> Token:
+    """
+    Create an access token and a refresh token for a user; the caller commits.
+
+    Args:
+        db: Database session
+        user_id: User the tokens are for
+        family_id: Family of the refresh token being rotated, None for a new login
+    """
+    now = datetime.now(timezone.utc)
+    access_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    jti = uuid.uuid4().hex
+    refresh_token = secrets.token_urlsafe(32)
+
+    db.add(RefreshToken(
+        user_id=user_id,
+        token_hash=hash_refresh_token(refresh_token),
+        family_id=family_id or uuid.uuid4().hex,
+        expires_at=now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        access_jti=jti,
+        access_expires_at=now + access_delta,
+    ))
+
+    return Token(
+        access_token=create_access_token(subject=str(user_id), expires_delta=access_delta, jti=jti),
+        refresh_token=refresh_token,
+        expires_in=int(access_delta.total_seconds()),
+    )
+
+
+def _revoke(db: Session, *criteria) -> int:
+    """Revoke matching refresh tokens and deny their live access tokens; the caller commits."""
+    rows = db.execute(
+        update(RefreshToken)
+        .where(*criteria, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=func.now())
+        .returning(RefreshToken.access_jti, RefreshToken.access_expires_at)
+        .execution_options(synchronize_session=False)
+    ).all()
+
+    now = time.time()
+    denied = {
+        jti: expires_at.timestamp() for jti, expires_at in rows if expires_at.timestamp() > now
+    }
+    if denied:
+        revoked_tokens.add(denied)
+        # Delivered on commit; other workers add the jtis to their own denylists
+        notify(
+            db,
+            AUTH_CHANNEL,
+            TOKENS_REVOKED,
+            jtis=denied if len(denied) <= MAX_NOTIFIED_JTIS else None,
+        )
+    return len(rows)
+
+
+def rotate_refresh_token(db: Session, refresh_token: str) -> Token:
+    """
+    Exchange a refresh token for a new token pair; the caller commits.
+
+    A token that was already rotated is being replayed, most likely by
+    whoever copied it, so its whole family is revoked. The caller should
+    commit before reporting the error so that revocation sticks. Within
+    REFRESH_TOKEN_REUSE_GRACE_SECONDS of its rotation, though, a replay is
+    taken to be a concurrent refresh by the same client, such as another
+    browser tab sharing the token, and gets its own pair in the family.
+
+    Raises:
+        InvalidRefreshToken: The token cannot be used
+    """
+    grace = timedelta(seconds=settings.REFRESH_TOKEN_REUSE_GRACE_SECONDS)
+    row = db.execute(
+        select(
+            RefreshToken,
+            User.is_active,
+            (RefreshToken.rotated_at > func.now() - grace).label("recently_rotated"),
+        )
+        .join(User, User.id == RefreshToken.user_id)
+        .where(
+            RefreshToken.token_hash == hash_refresh_token(refresh_token),
+            RefreshToken.expires_at > func.now(),
+        )
+        .with_for_update(of=RefreshToken)
+    ).first()
+    if row is None:
+        raise InvalidRefreshToken()
+
+    token, is_active, recently_rotated = row
+    if token.revoked_at is not None:
+        raise InvalidRefreshToken()
+    if token.rotated_at is not None and not recently_rotated:
+        logger.warning(f"Refresh token reuse for user {token.user_id}, revoking its session")
+        _revoke(db, RefreshToken.family_id == token.family_id)
+        raise InvalidRefreshToken()
+    if not is_active:
+        raise InvalidRefreshToken()
+
+    if token.rotated_at is None:
+        token.rotated_at = func.now()
+    return issue_tokens(db, token.user_id, token.family_id)
+
+
+def revoke_session(db: Session, access_jti: str) -> int:
+    """Revoke the login session an access token belongs to; the caller commits."""
+    family = select(RefreshToken.family_id).where(RefreshToken.access_jti == access_jti)
+    return _revoke(db, RefreshToken.family_id.in_(family.scalar_subquery()))
+
+
+def revoke_user_tokens(db: Session, user_id: int) -> int:
+    """Revoke every session of a user; the caller commits."""
+    return _revoke(db, RefreshToken.user_id == user_id)
+
+
+def load_revoked_tokens() -> None:
+    """Rebuild this worker's denylist from revoked rows whose access tokens are still live."""
+    db = SessionLocal()
+    try:
+        rows = db.execute(
+            select(RefreshToken.access_jti, RefreshToken.access_expires_at).where(
+                RefreshToken.revoked_at.isnot(None),
+                RefreshToken.access_expires_at > func.now(),
+            )
+        ).all()
+    finally:
+        db.close()
+
+    revoked_tokens.replace({jti: expires_at.timestamp() for jti, expires_at in rows})
+
+
+def purge_expired_refresh_tokens() -> int:
+    """Delete expired refresh tokens; their access tokens expired long before."""
+    db = SessionLocal()
+    try:
+        deleted = db.execute(
+            delete(RefreshToken).where(RefreshToken.expires_at < func.now())
+        ).rowcount
+        db.commit()
+        return deleted
+    finally:
+        db.close()
+
+
+async def run_denylist_sync() -> None:
+    """Apply token revocations committed by other workers; runs until cancelled."""
+    async with auth_events.subscribe() as queue:
+        try:
+            await run_in_threadpool(load_revoked_tokens)
+        except Exception as e:
+            logger.error(f"Loading revoked tokens failed: {e}")
+
+        while True:
+            event_name, payload = await queue.get()
+            if event_name != TOKENS_REVOKED and (event_name, payload) != RESYNC:
+                continue
+
+            try:
+                jtis = json.loads(payload).get("jtis")
+                if event_name == TOKENS_REVOKED and jtis is not None:
+                    revoked_tokens.add(jtis)
+                else:
+                    # Revocations may have been missed, or did not fit the payload
+                    await run_in_threadpool(load_revoked_tokens)
+            except Exception as e:
+                logger.error(f"Syncing revoked tokens failed: {e}")
+
+
+async def run_refresh_token_cleanup(interval: float) -> None:
+    """Periodically delete expired refresh tokens; runs until cancelled."""
+    while True:
+        try:
+            deleted = await run_in_threadpool(purge_expired_refresh_tokens)
+            if deleted:
+                logger.info(f"Purged {deleted} expired refresh tokens")
+        except Exception as e:
+            logger.error(f"Refresh token cleanup failed: {e}")
+        await asyncio.sleep(interval)
@@ -1,21 +1,114 @@
-from contextlib import asynccontextmanager
-from pathlib import Path
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from sqlalchemy import func, text, update
 
 from app.core.config import settings
-from app.core.database import Base, engine
+from app.core.contact_stats import counters_enabled, run_reconciliation
+from app.core.database import Base, async_engine, engine
+from app.core.email import email_configured, smtp_pool
+from app.core.events import auth_events, contact_events
+from app.core.images import STATIC_DIR
+from app.core.outbox import outbox_dispatcher
+from app.core.partitions import check_partitioning, maintain_partitions, run_partition_maintenance
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.principals import run_principal_invalidation
+from app.core.search_indexes import check_search_indexes
+from app.core.static_assets import CV_FILE, serve_static, static_manifest
+from app.core.tokens import run_denylist_sync, run_refresh_token_cleanup
 from app.api.routes import api_router
 import app.models  # noqa: F401 – ensure all models are registered on Base
+from app.models.contact import SEARCH_INDEXES
+from app.models.project import Project, project_search_vector
+
+
+def create_extensions() -> None:
+    """Extensions must exist before create_all builds the indexes that use them."""
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+
+def add_missing_columns() -> None:
+    """create_all leaves existing tables alone, so add columns introduced since they were created."""
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE projects ADD COLUMN IF NOT EXISTS search_vector tsvector"))
+
+
+def create_missing_indexes() -> None:
+    """
+    create_all skips indexes on tables that already exist, so add any that are missing.
+
+    Contact search indexes are left to scripts/create_contact_search_indexes.py,
+    which builds them without blocking inserts.
+    """
+    deferred = {index.name for index in SEARCH_INDEXES}
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                if index.name not in deferred:
+                    index.create(bind=conn, checkfirst=True)
+
+
+def backfill_project_search_vectors() -> None:
+    """Populate search_vector for rows written before full-text search existed."""
+    with engine.begin() as conn:
+        conn.execute(
+            update(Project)
+            .where(Project.search_vector.is_(None))
+            .values(
+                search_vector=project_search_vector(
+                    Project.title,
+                    func.array_to_string(Project.technologies, " "),
+                    Project.description,
+                    Project.long_description,
+                ),
+                updated_at=Project.updated_at,
+            )
+        )
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    create_extensions()
     Base.metadata.create_all(bind=engine)
+    # Indexes and the search backfill below need these columns on older databases
+    add_missing_columns()
+    create_missing_indexes()
+    check_partitioning()
+    # Inserts fail until the current month's partition exists
+    maintain_partitions()
+    check_search_indexes()
+    backfill_project_search_vectors()
+
+    background = [
+        asyncio.create_task(
+            run_partition_maintenance(settings.CONTACT_PARTITION_MAINTENANCE_SECONDS)
+        ),
+        asyncio.create_task(run_principal_invalidation()),
+        asyncio.create_task(run_denylist_sync()),
+        asyncio.create_task(run_refresh_token_cleanup(settings.REFRESH_TOKEN_CLEANUP_SECONDS)),
+    ]
+    if counters_enabled():
+        background.append(asyncio.create_task(
+            run_reconciliation(settings.CONTACT_STATS_RECONCILE_SECONDS)
+        ))
+    if email_configured():
+        background.append(asyncio.create_task(outbox_dispatcher.run()))
+
     yield
 
+    for task in background:
+        task.cancel()
+    for task in background:
+        with suppress(asyncio.CancelledError):
+            await task
+    await smtp_pool.close()
+    await contact_events.close()
+    await auth_events.close()
+    await async_engine.dispose()
+
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -32,15 +125,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Include API routes
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 
-# Serve static files (CV, etc.)
-static_dir = Path(__file__).resolve().parent.parent / "static"
-static_dir.mkdir(exist_ok=True)
-app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+# Serve static files (CV, etc.), by plain or content-hashed URL
+STATIC_DIR.mkdir(exist_ok=True)
+
+
+@app.api_route("/static/{path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+def static_files(path: str, request: Request):
+    return serve_static(request, path)
 
 
 @app.get("/")
@@ -49,6 +146,7 @@ def root():
         "name": settings.APP_NAME,
         "docs": f"{settings.API_V1_PREFIX}/docs",
         "health": "/health",
+        "cv": static_manifest.url_for(CV_FILE),
     }
 
 
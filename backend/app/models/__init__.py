@@ -1,6 +1,8 @@
 from app.models.user import User
 from app.models.project import Project
 from app.models.skill import Skill, SkillCategory
-from app.models.contact import ContactSubmission
+from app.models.contact import ContactSubmission, ContactStats
+from app.models.outbox import OutboxMessage
+from app.models.refresh_token import RefreshToken
 
-__all__ = ["User", "Project", "Skill", "SkillCategory", "ContactSubmission"]
+__all__ = ["User", "Project", "Skill", "SkillCategory", "ContactSubmission", "ContactStats", "OutboxMessage", "RefreshToken"]
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import String, Text, Boolean, DateTime
+from sqlalchemy import String, Text, Boolean, DateTime, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -9,8 +9,11 @@ from app.core.database import Base
 
 class ContactSubmission(Base):
     __tablename__ = "contact_submissions"
+    # Monthly range partitions are managed by app.core.partitions; Postgres
+    # requires the partition key in the primary key, hence (id, created_at)
+    __table_args__ = {"postgresql_partition_by": "RANGE (created_at)"}
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True, index=True)
     first_name: Mapped[str] = mapped_column(String(100))
     last_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
     email: Mapped[str] = mapped_column(String(255))
@@ -25,5 +28,42 @@ class ContactSubmission(Base):
     user_agent: Mapped[str | None] = mapped_column(String(500), nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), primary_key=True, server_default=func.now()
+    )
+
+
+# Inbox sort key, used for keyset pagination
+Index("ix_contact_submissions_created_at_id", ContactSubmission.created_at, ContactSubmission.id)
+
+# Searched by substring and trigram similarity (requires the pg_trgm extension)
+SEARCH_COLUMNS = (
+    ContactSubmission.first_name,
+    ContactSubmission.last_name,
+    ContactSubmission.email,
+    ContactSubmission.message,
+)
+# Too slow to build at startup on a large inbox; see scripts/create_contact_search_indexes.py
+SEARCH_INDEXES = [
+    Index(
+        f"ix_contact_submissions_{column.key}_trgm",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column.key: "gin_trgm_ops"},
+    )
+    for column in SEARCH_COLUMNS
+]
+
+
+class ContactStats(Base):
+    """Single-row counters kept in step with contact_submissions when CONTACT_STATS_MODE is "counter"."""
+
+    __tablename__ = "contact_stats"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    total: Mapped[int] = mapped_column(Integer, default=0)
+    unread: Mapped[int] = mapped_column(Integer, default=0)
+    archived: Mapped[int] = mapped_column(Integer, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
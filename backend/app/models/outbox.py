@@ -0,0 +1,48 @@
+from datetime import datetime
+
+from sqlalchemy import String, Text, Integer, DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.core.database import Base
+
+OUTBOX_PENDING = "pending"
+OUTBOX_FAILED = "failed"
+
+
+class OutboxMessage(Base):
+    """
+    Email waiting to be sent, written in the same transaction as the change that triggered it.
+
+    The payload carries everything needed to render the message, with no
+    foreign keys, so deleting the source row never blocks or loses a send.
+    Rows are deleted once delivered; rows that exhaust their retries stay
+    behind with status "failed".
+    """
+
+    __tablename__ = "email_outbox"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    kind: Mapped[str] = mapped_column(String(50))
+    payload: Mapped[dict] = mapped_column(JSONB)
+
+    status: Mapped[str] = mapped_column(String(20), default=OUTBOX_PENDING)
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+
+# Dispatcher claim order: only pending rows, soonest due first
+Index(
+    "ix_email_outbox_pending_next_attempt_at",
+    OutboxMessage.next_attempt_at,
+    OutboxMessage.id,
+    postgresql_where=OutboxMessage.status == OUTBOX_PENDING,
+)
@@ -1,9 +1,9 @@
 from datetime import datetime
 
-from sqlalchemy import String, Text, Boolean, Integer, DateTime, ARRAY
+from sqlalchemy import String, Text, Boolean, Integer, DateTime, Index, literal_column
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
 
 from app.core.database import Base
 
@@ -32,6 +32,9 @@ class Project(Base):
     is_published: Mapped[bool] = mapped_column(Boolean, default=False)
     display_order: Mapped[int] = mapped_column(Integer, default=0)
 
+    # Full-text search document, maintained by the admin write paths
+    search_vector: Mapped[str | None] = mapped_column(TSVECTOR, nullable=True, deferred=True)
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
@@ -39,3 +42,44 @@ class Project(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+
+
+# Matches the listing sort order, so keyset pagination is an index range scan
+Index(
+    "ix_projects_display_order_created_at_id",
+    Project.display_order,
+    Project.created_at.desc(),
+    Project.id.desc(),
+)
+
+# Serves @> / && technology filters and the facet aggregate
+Index("ix_projects_technologies", Project.technologies, postgresql_using="gin")
+
+Index("ix_projects_search_vector", Project.search_vector, postgresql_using="gin")
+
+
+SEARCH_CONFIG = literal_column("'english'::regconfig")
+
+# Fields that feed Project.search_vector
+SEARCH_FIELDS = ("title", "description", "long_description", "technologies")
+
+
+def project_search_vector(title, technologies, description, long_description):
+    """
+    Build the weighted tsvector expression for a project.
+
+    Arguments may be plain values or SQL expressions; technologies must
+    already be flattened to a space separated string.
+    """
+    def weighted(value, weight: str):
+        return func.setweight(
+            func.to_tsvector(SEARCH_CONFIG, func.coalesce(value, "")),
+            literal_column(f"'{weight}'"),
+        )
+
+    return (
+        weighted(title, "A")
+        .op("||")(weighted(technologies, "A"))
+        .op("||")(weighted(description, "B"))
+        .op("||")(weighted(long_description, "C"))
+    )
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from sqlalchemy import String, DateTime, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class RefreshToken(Base):
+    """
+    One refresh token and the access token issued alongside it.
+
+    Only a SHA-256 digest of the refresh token is stored. Each refresh
+    rotates the token: the row is marked rotated and a new row joins the
+    same family. Presenting a rotated token again, after a short grace
+    period for concurrent refreshes, means it was copied, so the whole
+    family is revoked. Revoked rows still carry their access
+    token's jti until it expires, which is how workers rebuild the
+    in-memory denylist.
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    token_hash: Mapped[str] = mapped_column(String(64), unique=True)
+    family_id: Mapped[str] = mapped_column(String(32), index=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+
+    access_jti: Mapped[str] = mapped_column(String(32), index=True)
+    access_expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+    rotated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    revoked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+
+# Denylist rebuild: revoked rows whose access token may still be live
+Index(
+    "ix_refresh_tokens_revoked_access_expires_at",
+    RefreshToken.access_expires_at,
+    postgresql_where=RefreshToken.revoked_at.isnot(None),
+)
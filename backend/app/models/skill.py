@@ -1,7 +1,7 @@
 from datetime import datetime
 
-from sqlalchemy import String, Integer, DateTime, ForeignKey, Boolean
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, Integer, DateTime, ForeignKey, Boolean, select
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.core.database import Base
@@ -50,3 +50,45 @@ class Skill(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+
+
+def load_published_skill_tree(db: Session, slug: str | None = None) -> list[dict]:
+    """
+    Load published categories with their published skills, in display order.
+
+    Runs exactly two queries regardless of how many categories exist, with
+    filtering and sorting done in SQL. Rows are selected as plain columns,
+    so nothing enters the session's identity map and the ORM relationship
+    is never touched.
+
+    Args:
+        db: Database session
+        slug: Restrict to a single category
+
+    Returns:
+        Category dicts, each with a "skills" list of skill dicts
+    """
+    category_query = (
+        select(SkillCategory.__table__)
+        .where(SkillCategory.is_published == True)
+        .order_by(SkillCategory.display_order, SkillCategory.id)
+    )
+    if slug is not None:
+        category_query = category_query.where(SkillCategory.slug == slug)
+
+    categories = {
+        row["id"]: {**row, "skills": []}
+        for row in db.execute(category_query).mappings()
+    }
+    if not categories:
+        return []
+
+    skills = db.execute(
+        select(Skill.__table__)
+        .where(Skill.is_published == True, Skill.category_id.in_(list(categories)))
+        .order_by(Skill.category_id, Skill.display_order, Skill.id)
+    ).mappings()
+    for row in skills:
+        categories[row["category_id"]]["skills"].append(dict(row))
+
+    return list(categories.values())
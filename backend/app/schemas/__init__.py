@@ -8,16 +8,20 @@ from app.schemas.user import (
 from app.schemas.project import (
     ProjectCreate,
     ProjectUpdate,
+    ProjectBulkPatch,
     ProjectResponse,
     ProjectListResponse,
     ProjectImage,
+    TechnologyFacet,
 )
 from app.schemas.skill import (
     SkillCreate,
     SkillUpdate,
+    SkillBulkPatch,
     SkillResponse,
     SkillCategoryCreate,
     SkillCategoryUpdate,
+    SkillCategoryBulkPatch,
     SkillCategoryResponse,
     SkillCategoryListResponse,
 )
@@ -27,6 +31,10 @@ from app.schemas.contact import (
     ContactSubmissionResponse,
     ContactSubmissionPublicResponse,
 )
+from app.schemas.portfolio import (
+    PortfolioMeta,
+    PortfolioBundleResponse,
+)
 
 __all__ = [
     "UserCreate",
@@ -36,18 +44,24 @@ __all__ = [
     "TokenPayload",
     "ProjectCreate",
     "ProjectUpdate",
+    "ProjectBulkPatch",
     "ProjectResponse",
     "ProjectListResponse",
     "ProjectImage",
+    "TechnologyFacet",
     "SkillCreate",
     "SkillUpdate",
+    "SkillBulkPatch",
     "SkillResponse",
     "SkillCategoryCreate",
     "SkillCategoryUpdate",
+    "SkillCategoryBulkPatch",
     "SkillCategoryResponse",
     "SkillCategoryListResponse",
     "ContactSubmissionCreate",
     "ContactSubmissionUpdate",
     "ContactSubmissionResponse",
     "ContactSubmissionPublicResponse",
+    "PortfolioMeta",
+    "PortfolioBundleResponse",
 ]
@@ -0,0 +1,74 @@
+from datetime import datetime
+from typing import Annotated, Literal, Union
+
+from pydantic import BaseModel, Field
+
+from app.schemas.contact import ContactSubmissionBase
+from app.schemas.project import ProjectBase
+from app.schemas.skill import SkillBase, SkillCategoryBase
+
+
+# Records carry natural keys (slugs) instead of ids, so content can move
+# between databases whose id sequences differ
+class ProjectRecord(ProjectBase):
+    created_at: datetime | None = None
+
+    class Config:
+        from_attributes = True
+
+
+class SkillCategoryRecord(SkillCategoryBase):
+    class Config:
+        from_attributes = True
+
+
+class SkillRecord(SkillBase):
+    category_slug: str
+
+    class Config:
+        from_attributes = True
+
+
+class ContactSubmissionRecord(ContactSubmissionBase):
+    is_read: bool = False
+    is_archived: bool = False
+    ip_address: str | None = None
+    user_agent: str | None = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+# One NDJSON line each
+class ProjectLine(BaseModel):
+    type: Literal["project"] = "project"
+    data: ProjectRecord
+
+
+class SkillCategoryLine(BaseModel):
+    type: Literal["skill_category"] = "skill_category"
+    data: SkillCategoryRecord
+
+
+class SkillLine(BaseModel):
+    type: Literal["skill"] = "skill"
+    data: SkillRecord
+
+
+class ContactSubmissionLine(BaseModel):
+    type: Literal["contact_submission"] = "contact_submission"
+    data: ContactSubmissionRecord
+
+
+ContentLine = Annotated[
+    Union[ProjectLine, SkillCategoryLine, SkillLine, ContactSubmissionLine],
+    Field(discriminator="type"),
+]
+
+
+class ContentImportResult(BaseModel):
+    projects: int = 0
+    skill_categories: int = 0
+    skills: int = 0
+    contact_submissions: int = 0
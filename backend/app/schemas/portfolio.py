@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+
+from app.schemas.project import ProjectListResponse
+from app.schemas.skill import SkillCategoryListResponse
+
+
+class PortfolioMeta(BaseModel):
+    name: str
+    docs: str
+    health: str
+    cv: str | None = None
+
+
+class PortfolioBundleResponse(BaseModel):
+    meta: PortfolioMeta
+    projects: list[ProjectListResponse]
+    skill_categories: list[SkillCategoryListResponse]
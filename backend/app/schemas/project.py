@@ -1,5 +1,7 @@
 from datetime import datetime
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, HttpUrl, computed_field
+
+from app.core.images import image_srcset
 
 
 class ProjectImage(BaseModel):
@@ -40,6 +42,13 @@ class ProjectUpdate(BaseModel):
     display_order: int | None = None
 
 
+class ProjectBulkPatch(BaseModel):
+    id: int
+    display_order: int | None = None
+    is_featured: bool | None = None
+    is_published: bool | None = None
+
+
 class ProjectResponse(ProjectBase):
     id: int
     created_at: datetime
@@ -61,5 +70,18 @@ class ProjectListResponse(BaseModel):
     is_featured: bool
     display_order: int
 
+    @computed_field
+    @property
+    def srcset(self) -> dict[str, str]:
+        """Responsive variants of the primary (or first) image, keyed by format."""
+        image = next((img for img in self.images if img.is_primary), None)
+        image = image or (self.images[0] if self.images else None)
+        return image_srcset(image.url) if image else {}
+
     class Config:
         from_attributes = True
+
+
+class TechnologyFacet(BaseModel):
+    name: str
+    count: int
@@ -22,6 +22,12 @@ class SkillUpdate(BaseModel):
     is_published: bool | None = None
 
 
+class SkillBulkPatch(BaseModel):
+    id: int
+    display_order: int | None = None
+    is_published: bool | None = None
+
+
 class SkillResponse(SkillBase):
     id: int
     category_id: int
@@ -55,6 +61,12 @@ class SkillCategoryUpdate(BaseModel):
     is_published: bool | None = None
 
 
+class SkillCategoryBulkPatch(BaseModel):
+    id: int
+    display_order: int | None = None
+    is_published: bool | None = None
+
+
 class SkillCategoryResponse(SkillCategoryBase):
     id: int
     skills: list[SkillResponse] = []
@@ -0,0 +1,98 @@
+"""
+Compare the sync and async database paths under concurrent load.
+
+Runs the same query through both paths the app uses:
+
+- sync: a Session on the anyio threadpool (40 threads by default), which is
+  what sync routes, and async routes using get_db, effectively get
+- async: an AsyncSession from get_async_db on the event loop
+
+Each path uses its own configured connection pool, so the numbers reflect
+the app's real settings. Use --sleep-ms to add server-side latency
+(pg_sleep) and make the threadpool ceiling visible.
+
+Usage, from backend/ with DATABASE_URL pointing at a live database:
+    python scripts/bench_async_db.py --requests 2000 --concurrency 200 --sleep-ms 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from anyio import to_thread  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+from app.core.database import AsyncSessionLocal, SessionLocal, async_engine, engine  # noqa: E402
+
+
+def _statement(sleep_ms: float):
+    if sleep_ms:
+        return text("SELECT pg_sleep(:seconds)").bindparams(seconds=sleep_ms / 1000)
+    return text("SELECT count(*) FROM projects")
+
+
+def _sync_once(sleep_ms: float) -> None:
+    db = SessionLocal()
+    try:
+        db.execute(_statement(sleep_ms)).all()
+    finally:
+        db.close()
+
+
+async def _sync_path(sleep_ms: float) -> None:
+    await to_thread.run_sync(_sync_once, sleep_ms)
+
+
+async def _async_path(sleep_ms: float) -> None:
+    async with AsyncSessionLocal() as db:
+        (await db.execute(_statement(sleep_ms))).all()
+
+
+async def _run(label: str, call, requests: int, concurrency: int, sleep_ms: float) -> None:
+    gate = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one() -> None:
+        async with gate:
+            started = time.perf_counter()
+            await call(sleep_ms)
+            latencies.append(time.perf_counter() - started)
+
+    # Warm the pool so connection setup isn't measured
+    await asyncio.gather(*(call(0) for _ in range(min(concurrency, 20))))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    cuts = statistics.quantiles(latencies, n=100)
+    print(
+        f"{label:<6} {requests / elapsed:8.0f} req/s   "
+        f"p50 {cuts[49] * 1000:7.1f} ms   p95 {cuts[94] * 1000:7.1f} ms   "
+        f"p99 {cuts[98] * 1000:7.1f} ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--sleep-ms", type=float, default=0, help="Server-side latency per query")
+    args = parser.parse_args()
+
+    print(f"{args.requests} queries, {args.concurrency} concurrent, {args.sleep_ms} ms server latency")
+    try:
+        await _run("sync", _sync_path, args.requests, args.concurrency, args.sleep_ms)
+        await _run("async", _async_path, args.requests, args.concurrency, args.sleep_ms)
+    finally:
+        engine.dispose()
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,54 @@
+"""
+Measure per-request token verification cost with and without the verified-token cache.
+
+"uncached" clears the cache before every call, so each decode runs the
+full python-jose HMAC check and claim parsing, as every request did
+before the cache. "cached" decodes the same token repeatedly, as a
+logged-in admin panel does. No database is needed.
+
+Usage, from backend/:
+    python scripts/bench_token_cache.py --iterations 20000
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.security import create_access_token, decode_access_token, verified_tokens  # noqa: E402
+
+
+def _uncached(token: str) -> None:
+    verified_tokens.clear()
+    decode_access_token(token)
+
+
+def _report(label: str, seconds: float, iterations: int) -> float:
+    per_call = seconds / iterations * 1e6
+    print(f"{label:<9} {per_call:8.2f} us/request   {iterations / seconds:10.0f} req/s")
+    return per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    token = create_access_token(subject="1")
+    if decode_access_token(token) != "1":
+        raise SystemExit("Token did not round-trip; check SECRET_KEY and ALGORITHM")
+
+    uncached = _report(
+        "uncached", timeit.timeit(lambda: _uncached(token), number=args.iterations), args.iterations
+    )
+    decode_access_token(token)
+    cached = _report(
+        "cached", timeit.timeit(lambda: decode_access_token(token), number=args.iterations), args.iterations
+    )
+    print(f"speedup   {uncached / cached:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Build the trigram indexes used by contact search without blocking writes.
+
+The API no longer creates these on startup, since building GIN indexes
+over an existing inbox holds a lock that stalls contact form submissions.
+This builds each one with CREATE INDEX CONCURRENTLY, partition by
+partition, and can be re-run safely if interrupted.
+
+Usage, from backend/:
+    python scripts/create_contact_search_indexes.py
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import app.main  # noqa: E402,F401 – registers all models
+from app.core.search_indexes import build_search_indexes  # noqa: E402
+
+
+def main() -> None:
+    argparse.ArgumentParser(description=__doc__.splitlines()[1]).parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    built = build_search_indexes()
+
+    if built:
+        print(f"Built {', '.join(built)}.")
+    else:
+        print("All contact search indexes already exist.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Convert an existing contact_submissions table to monthly range partitions.
+
+Databases created before partitioning have a plain contact_submissions
+table, which create_all leaves alone. This rebuilds it as a partitioned
+table in one transaction. Writes to the table are blocked while it runs,
+so stop the API first on large inboxes.
+
+Usage, from backend/:
+    python scripts/partition_contact_submissions.py [--drop-old]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import app.main  # noqa: E402,F401 – registers all models
+from app.core.database import engine  # noqa: E402
+from app.core.partitions import convert_to_partitioned  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--drop-old",
+        action="store_true",
+        help="Drop the old table after copying instead of keeping it as contact_submissions_unpartitioned",
+    )
+    args = parser.parse_args()
+
+    with engine.begin() as conn:
+        old = convert_to_partitioned(conn, drop_old=args.drop_old)
+
+    if old:
+        print(f"Converted. The original table is kept as {old}; drop it once verified.")
+    else:
+        print("Converted. The original table was dropped.")
+
+
+if __name__ == "__main__":
+    main()
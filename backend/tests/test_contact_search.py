@@ -0,0 +1,69 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.deps import get_current_admin
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.principals import Principal
+from app.main import app
+from app.models.contact import ContactSubmission
+
+
+@pytest.fixture
+def client(database):
+    admin = Principal(id=1, is_active=True, is_admin=True)
+    app.dependency_overrides[get_current_admin] = lambda: admin
+    try:
+        # Not entered as a context manager, so the lifespan's background tasks don't start
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+
+
+def add_submissions(db, messages: list[str]) -> list[int]:
+    submissions = [
+        ContactSubmission(first_name="Sam", email="sam@example.com", message=message)
+        for message in messages
+    ]
+    db.add_all(submissions)
+    db.commit()
+    return [submission.id for submission in submissions]
+
+
+def search_all_pages(client, q: str, limit: int) -> list[int]:
+    ids, cursor = [], None
+    while True:
+        params = {"q": q, "limit": limit, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/v1/contact/search", params=params)
+        assert response.status_code == 200
+        ids.extend(submission["id"] for submission in response.json())
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            return ids
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3])
+def test_pages_through_tied_ranks(db, client, limit):
+    # Identical messages give identical, non-round float4 ranks
+    tied = add_submissions(db, ["invoice for the portfolio redesign"] * 7)
+
+    ids = search_all_pages(client, "portfolio redesgn", limit)
+
+    assert ids == sorted(tied, reverse=True)
+
+
+def test_pages_through_mixed_ranks(db, client):
+    ids = add_submissions(db, [
+        "portfolio redesign quote",
+        "question about a portfolio",
+        "portfolio redesign quote",
+        "redesign of my blog",
+        "portfolio redesign quote",
+    ])
+
+    params = {"q": "portfolio redesign", "limit": 50}
+    first_page = client.get("/api/v1/contact/search", params=params).json()
+    paged = search_all_pages(client, "portfolio redesign", 2)
+
+    assert paged == [submission["id"] for submission in first_page]
+    assert len(set(paged)) == len(paged)
+    assert set(paged) <= set(ids)
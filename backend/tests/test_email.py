@@ -0,0 +1,30 @@
+import pytest
+
+from app.core.email import render_contact_digest, render_contact_notification
+
+PAYLOAD = {
+    "first_name": "<b>Mallory</b>",
+    "last_name": None,
+    "email": 'x"><script>alert(1)</script>@example.com',
+    "message": "<img src=x onerror=alert(1)>",
+}
+
+
+@pytest.mark.parametrize(
+    "render",
+    [
+        lambda: render_contact_notification(**PAYLOAD),
+        lambda: render_contact_digest([PAYLOAD, PAYLOAD]),
+    ],
+    ids=["single", "digest"],
+)
+def test_submitted_fields_are_escaped_in_html(render):
+    _, body_html, body_text = render()
+
+    assert "<b>Mallory" not in body_html
+    assert "<script>" not in body_html
+    assert "<img" not in body_html
+    assert 'href="mailto:x"' not in body_html
+    assert "&lt;img src=x onerror=alert(1)&gt;" in body_html
+    # The plain text part is shown as text, so it stays verbatim
+    assert PAYLOAD["message"] in body_text
@@ -0,0 +1,104 @@
+import httpx
+import pytest
+
+from app.api.routes import auth
+from app.core import rate_limit, security
+from app.core.config import settings
+from app.core.database import async_engine
+from app.core.rate_limit import TokenBucketLimiter
+from app.core.security import PasswordHasher
+from app.main import app
+from conftest import PASSWORD, USER_EMAIL
+
+LOGIN_URL = f"{settings.API_V1_PREFIX}/auth/login"
+
+
+@pytest.fixture(autouse=True)
+def limiters(monkeypatch):
+    """Small, fresh buckets that barely refill during a test."""
+    ip_limiter = TokenBucketLimiter(rate=1 / 3600, burst=6, max_keys=100)
+    account_limiter = TokenBucketLimiter(rate=1 / 3600, burst=3, max_keys=100)
+    monkeypatch.setattr(rate_limit, "login_ip_limiter", ip_limiter)
+    monkeypatch.setattr(rate_limit, "login_account_limiter", account_limiter)
+    monkeypatch.setattr(auth, "login_account_limiter", account_limiter)
+    return ip_limiter, account_limiter
+
+
+@pytest.fixture
+def verifications(monkeypatch):
+    """Count password verifications, i.e. bcrypt work done."""
+    calls = []
+    verify = security.verify_password
+
+    def counting_verify(plain_password, hashed_password):
+        calls.append(plain_password)
+        return verify(plain_password, hashed_password)
+
+    monkeypatch.setattr(security, "verify_password", counting_verify)
+    return calls
+
+
+@pytest.fixture
+async def client(database):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+    # Pooled connections belong to this test's event loop
+    await async_engine.dispose()
+
+
+async def login(client, username: str, password: str) -> httpx.Response:
+    return await client.post(LOGIN_URL, data={"username": username, "password": password})
+
+
+async def test_account_limit_applies_before_hashing(client, user, verifications):
+    # Case and surrounding whitespace don't make a new account bucket
+    for username in (USER_EMAIL, USER_EMAIL.upper(), f" {USER_EMAIL} "):
+        assert (await login(client, username, "wrong")).status_code == 401
+    verified_before = len(verifications)
+
+    response = await login(client, USER_EMAIL, PASSWORD)
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert len(verifications) == verified_before
+
+
+async def test_ip_limit_spans_accounts(client, user, verifications):
+    for n in range(6):
+        assert (await login(client, f"user{n}@example.com", "wrong")).status_code == 401
+
+    assert (await login(client, USER_EMAIL, PASSWORD)).status_code == 429
+    # Unknown accounts are rejected without hashing
+    assert verifications == []
+
+
+async def test_success_resets_the_account_limit(client, user, limiters):
+    ip_limiter, _ = limiters
+    ip_limiter.burst = 100
+
+    for _ in range(2):
+        for _ in range(2):
+            assert (await login(client, USER_EMAIL, "wrong")).status_code == 401
+        assert (await login(client, USER_EMAIL, PASSWORD)).status_code == 200
+
+    assert (await login(client, USER_EMAIL, "wrong")).status_code == 401
+
+
+async def test_rehashes_on_login_when_the_cost_changes(client, db, user, monkeypatch):
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+
+    assert (await login(client, USER_EMAIL, PASSWORD)).status_code == 200
+
+    db.refresh(user)
+    assert user.hashed_password.startswith("$2b$05$")
+    assert security.verify_password(PASSWORD, user.hashed_password)
+
+
+async def test_busy_hasher_returns_503(client, user, monkeypatch):
+    monkeypatch.setattr(auth, "password_hasher", PasswordHasher(workers=1, max_pending=0))
+
+    response = await login(client, USER_EMAIL, PASSWORD)
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
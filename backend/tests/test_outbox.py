@@ -0,0 +1,164 @@
+import socket
+from email import message_from_bytes
+
+import httpx
+import pytest
+from aiosmtpd.controller import Controller
+from sqlalchemy import func, select, update
+
+from app.core.config import settings
+from app.core.database import async_engine
+from app.core.deps import get_current_admin
+from app.core.email import smtp_pool
+from app.core.outbox import OutboxDispatcher, enqueue_contact_notification
+from app.core.principals import Principal
+from app.main import app
+from app.models.contact import ContactSubmission
+from app.models.outbox import OUTBOX_FAILED, OUTBOX_PENDING, OutboxMessage
+
+
+class RecordingHandler:
+    """Accepts messages, or answers DATA with a temporary failure while reject is set."""
+
+    def __init__(self):
+        self.messages = []
+        self.reject = False
+
+    async def handle_DATA(self, server, session, envelope):
+        if self.reject:
+            return "451 Requested action aborted: try again later"
+        self.messages.append(message_from_bytes(envelope.content))
+        return "250 OK"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+async def smtp_server(monkeypatch):
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=free_port())
+    controller.start()
+
+    monkeypatch.setattr(settings, "SMTP_HOST", "127.0.0.1")
+    monkeypatch.setattr(settings, "SMTP_PORT", controller.port)
+    monkeypatch.setattr(settings, "SMTP_START_TLS", False)
+    monkeypatch.setattr(settings, "SMTP_USER", None)
+    monkeypatch.setattr(settings, "EMAIL_FROM", "portfolio@example.com")
+    monkeypatch.setattr(settings, "NOTIFICATION_EMAIL", "owner@example.com")
+    monkeypatch.setattr(settings, "NOTIFICATION_DIGEST_ENABLED", False)
+    try:
+        yield handler
+    finally:
+        await smtp_pool.close()
+        controller.stop()
+
+
+@pytest.fixture
+def dispatcher():
+    return OutboxDispatcher(batch_size=10, poll_interval=1, lease_seconds=60, max_attempts=2)
+
+
+def submit(db, first_name="Ada") -> None:
+    submission = ContactSubmission(
+        first_name=first_name, last_name="Lovelace", email="ada@example.com", message="Hello"
+    )
+    db.add(submission)
+    db.flush()
+    enqueue_contact_notification(db, submission)
+    db.commit()
+
+
+def outbox_rows(db) -> list[OutboxMessage]:
+    db.expire_all()
+    return db.scalars(select(OutboxMessage).order_by(OutboxMessage.id)).all()
+
+
+def make_due(db) -> None:
+    db.execute(update(OutboxMessage).values(next_attempt_at=func.now()))
+    db.commit()
+
+
+async def test_delivers_and_deletes(db, smtp_server, dispatcher):
+    submit(db, "Ada")
+    submit(db, "Grace")
+
+    assert await dispatcher.dispatch_once() == 2
+
+    subjects = sorted(message["Subject"] for message in smtp_server.messages)
+    assert subjects == [
+        "New Contact Form Submission from Ada Lovelace",
+        "New Contact Form Submission from Grace Lovelace",
+    ]
+    assert all(message["To"] == "owner@example.com" for message in smtp_server.messages)
+    assert outbox_rows(db) == []
+
+
+async def test_retries_after_temporary_failure(db, smtp_server, dispatcher):
+    submit(db)
+    smtp_server.reject = True
+
+    assert await dispatcher.dispatch_once() == 1
+
+    [row] = outbox_rows(db)
+    assert row.status == OUTBOX_PENDING
+    assert row.attempts == 1
+    assert "451" in row.last_error
+    # Backed off, so the next pass has nothing due
+    assert await dispatcher.dispatch_once() == 0
+
+    smtp_server.reject = False
+    make_due(db)
+    assert await dispatcher.dispatch_once() == 1
+
+    assert len(smtp_server.messages) == 1
+    assert outbox_rows(db) == []
+
+
+async def test_gives_up_after_max_attempts(db, smtp_server, dispatcher):
+    submit(db)
+    smtp_server.reject = True
+
+    for _ in range(dispatcher.max_attempts):
+        make_due(db)
+        assert await dispatcher.dispatch_once() == 1
+
+    [row] = outbox_rows(db)
+    assert row.status == OUTBOX_FAILED
+    assert row.attempts == dispatcher.max_attempts
+    make_due(db)
+    assert await dispatcher.dispatch_once() == 0
+
+
+def test_not_enqueued_without_smtp(db, monkeypatch):
+    monkeypatch.setattr(settings, "NOTIFICATION_EMAIL", "owner@example.com")
+    monkeypatch.setattr(settings, "SMTP_HOST", None)
+
+    submit(db)
+
+    assert outbox_rows(db) == []
+
+
+async def test_retry_endpoint_requeues_failed_messages(db, smtp_server, dispatcher):
+    submit(db)
+    db.execute(update(OutboxMessage).values(status=OUTBOX_FAILED, attempts=dispatcher.max_attempts))
+    db.commit()
+
+    admin = Principal(id=1, is_active=True, is_admin=True)
+    app.dependency_overrides[get_current_admin] = lambda: admin
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post(f"{settings.API_V1_PREFIX}/outbox/retry")
+    finally:
+        app.dependency_overrides.clear()
+        await async_engine.dispose()
+
+    assert response.json() == {"requeued": 1}
+    [row] = outbox_rows(db)
+    assert (row.status, row.attempts) == (OUTBOX_PENDING, 0)
+    assert await dispatcher.dispatch_once() == 1
+    assert len(smtp_server.messages) == 1
@@ -0,0 +1,35 @@
+import math
+
+from app.core.rate_limit import TokenBucketLimiter, hit_all, too_many_requests
+
+
+def test_bucket_allows_burst_then_rejects():
+    limiter = TokenBucketLimiter(rate=1, burst=2, max_keys=10)
+
+    assert limiter.hit("a") == 0
+    assert limiter.hit("a") == 0
+    assert 0 < limiter.hit("a") <= 1
+    assert limiter.hit("b") == 0
+
+
+def test_hit_all_takes_nothing_when_one_limiter_rejects():
+    per_key = TokenBucketLimiter(rate=1, burst=5, max_keys=10)
+    shared = TokenBucketLimiter(rate=1, burst=1)
+
+    assert hit_all((per_key, "a"), (shared, "")) == 0
+    assert hit_all((per_key, "a"), (shared, "")) > 0
+
+    # Only the accepted request was charged to the per-key bucket
+    assert [per_key.hit("a") for _ in range(4)] == [0, 0, 0, 0]
+    assert per_key.hit("a") > 0
+
+
+def test_zero_rate_rejects_without_retry_after():
+    limiter = TokenBucketLimiter(rate=0, burst=1)
+    assert limiter.hit() == 0
+
+    retry_after = limiter.hit()
+
+    assert math.isinf(retry_after)
+    assert too_many_requests(retry_after).headers is None
+    assert too_many_requests(0.2).headers == {"Retry-After": "1"}
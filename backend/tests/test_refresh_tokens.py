@@ -0,0 +1,241 @@
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from sqlalchemy import select, update
+
+from app.core.config import settings
+from app.core.database import async_engine
+from app.core.principals import principal_cache
+from app.core.security import (
+    decode_access_claims,
+    decode_access_token,
+    revoked_tokens,
+    verified_tokens,
+)
+from app.core.tokens import (
+    InvalidRefreshToken,
+    hash_refresh_token,
+    issue_tokens,
+    load_revoked_tokens,
+    purge_expired_refresh_tokens,
+    revoke_session,
+    revoke_user_tokens,
+    rotate_refresh_token,
+)
+from app.main import app
+from app.models.refresh_token import RefreshToken
+from conftest import PASSWORD, USER_EMAIL
+
+
+@pytest.fixture(autouse=True)
+def clean_caches():
+    yield
+    revoked_tokens.replace({})
+    verified_tokens.clear()
+    principal_cache.clear()
+
+
+def login(db, user):
+    tokens = issue_tokens(db, user.id)
+    db.commit()
+    return tokens
+
+
+def refresh(db, refresh_token: str):
+    try:
+        return rotate_refresh_token(db, refresh_token)
+    finally:
+        # As the route does, so a reuse's revocation sticks
+        db.commit()
+
+
+def row(db, refresh_token: str) -> RefreshToken:
+    db.expire_all()
+    return db.scalar(
+        select(RefreshToken).where(RefreshToken.token_hash == hash_refresh_token(refresh_token))
+    )
+
+
+def age_rotation(db, refresh_token: str) -> None:
+    """Move a rotation back past the reuse grace window."""
+    grace = timedelta(seconds=settings.REFRESH_TOKEN_REUSE_GRACE_SECONDS + 1)
+    db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.token_hash == hash_refresh_token(refresh_token))
+        .values(rotated_at=RefreshToken.rotated_at - grace)
+    )
+    db.commit()
+
+
+def is_accepted(access_token: str) -> bool:
+    return decode_access_token(access_token) is not None
+
+
+def test_rotation_issues_a_new_pair_in_the_same_family(db, user):
+    first = login(db, user)
+
+    second = refresh(db, first.refresh_token)
+
+    assert second.refresh_token != first.refresh_token
+    assert decode_access_token(second.access_token) == str(user.id)
+    assert row(db, first.refresh_token).rotated_at is not None
+    assert row(db, second.refresh_token).family_id == row(db, first.refresh_token).family_id
+    # Rotation alone doesn't cut short the previous access token
+    assert is_accepted(first.access_token)
+
+
+def test_reuse_revokes_the_whole_family(db, user):
+    first = login(db, user)
+    second = refresh(db, first.refresh_token)
+    other_session = login(db, user)
+    age_rotation(db, first.refresh_token)
+
+    with pytest.raises(InvalidRefreshToken):
+        refresh(db, first.refresh_token)
+
+    assert row(db, second.refresh_token).revoked_at is not None
+    assert not is_accepted(first.access_token)
+    assert not is_accepted(second.access_token)
+    with pytest.raises(InvalidRefreshToken):
+        refresh(db, second.refresh_token)
+
+    assert is_accepted(other_session.access_token)
+    assert refresh(db, other_session.refresh_token)
+
+
+def test_concurrent_refresh_within_grace_is_not_reuse(db, user):
+    first = login(db, user)
+    # Two tabs sharing the token refresh at the same moment
+    second = refresh(db, first.refresh_token)
+    sibling = refresh(db, first.refresh_token)
+
+    assert sibling.refresh_token != second.refresh_token
+    assert row(db, sibling.refresh_token).family_id == row(db, first.refresh_token).family_id
+    assert all(is_accepted(tokens.access_token) for tokens in (first, second, sibling))
+    assert refresh(db, second.refresh_token)
+    assert refresh(db, sibling.refresh_token)
+
+    # The window runs from the first rotation; repeated replays don't extend it
+    age_rotation(db, first.refresh_token)
+    with pytest.raises(InvalidRefreshToken):
+        refresh(db, first.refresh_token)
+    assert not is_accepted(sibling.access_token)
+
+
+def test_unknown_expired_and_inactive_are_rejected(db, user):
+    with pytest.raises(InvalidRefreshToken):
+        refresh(db, "not-a-token")
+
+    expired = login(db, user)
+    db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.token_hash == hash_refresh_token(expired.refresh_token))
+        .values(expires_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+    )
+    db.commit()
+    with pytest.raises(InvalidRefreshToken):
+        refresh(db, expired.refresh_token)
+
+    live = login(db, user)
+    user.is_active = False
+    db.commit()
+    with pytest.raises(InvalidRefreshToken):
+        refresh(db, live.refresh_token)
+
+
+def test_revoke_session_spares_other_sessions(db, user):
+    first = login(db, user)
+    second = login(db, user)
+
+    revoke_session(db, decode_access_claims(first.access_token).jti)
+    db.commit()
+
+    assert not is_accepted(first.access_token)
+    assert is_accepted(second.access_token)
+
+    assert revoke_user_tokens(db, user.id) == 1
+    db.commit()
+    assert not is_accepted(second.access_token)
+
+
+def test_denylist_is_rebuilt_from_the_database(db, user):
+    tokens = login(db, user)
+    revoke_user_tokens(db, user.id)
+    db.commit()
+
+    # A worker that missed the notification, or just started
+    revoked_tokens.replace({})
+    assert is_accepted(tokens.access_token)
+
+    load_revoked_tokens()
+
+    assert not is_accepted(tokens.access_token)
+
+
+def test_purges_expired_refresh_tokens(db, user):
+    expired, live = login(db, user), login(db, user)
+    db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.token_hash == hash_refresh_token(expired.refresh_token))
+        .values(expires_at=datetime.now(timezone.utc) - timedelta(days=1))
+    )
+    db.commit()
+
+    assert purge_expired_refresh_tokens() == 1
+    assert row(db, expired.refresh_token) is None
+    assert row(db, live.refresh_token) is not None
+
+
+@pytest.fixture
+async def client(database):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url=f"http://test{settings.API_V1_PREFIX}"
+    ) as client:
+        yield client
+    # Pooled connections belong to this test's event loop
+    await async_engine.dispose()
+
+
+async def api_login(client) -> dict:
+    response = await client.post(
+        "/auth/login", data={"username": USER_EMAIL, "password": PASSWORD}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+async def me(client, access_token: str) -> int:
+    response = await client.get("/auth/me", headers={"Authorization": f"Bearer {access_token}"})
+    return response.status_code
+
+
+async def test_api_refresh_reuse_logs_the_session_out(client, user, monkeypatch):
+    monkeypatch.setattr(settings, "REFRESH_TOKEN_REUSE_GRACE_SECONDS", 0)
+    first = await api_login(client)
+    response = await client.post("/auth/refresh", json={"refresh_token": first["refresh_token"]})
+    assert response.status_code == 200
+    second = response.json()
+    assert await me(client, second["access_token"]) == 200
+
+    replay = await client.post("/auth/refresh", json={"refresh_token": first["refresh_token"]})
+
+    assert replay.status_code == 401
+    assert await me(client, second["access_token"]) == 401
+    retry = await client.post("/auth/refresh", json={"refresh_token": second["refresh_token"]})
+    assert retry.status_code == 401
+
+
+async def test_api_logout_revokes_access_and_refresh_tokens(client, user):
+    tokens = await api_login(client)
+    assert await me(client, tokens["access_token"]) == 200
+
+    response = await client.post(
+        "/auth/logout", headers={"Authorization": f"Bearer {tokens['access_token']}"}
+    )
+
+    assert response.status_code == 204
+    assert await me(client, tokens["access_token"]) == 401
+    retry = await client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert retry.status_code == 401
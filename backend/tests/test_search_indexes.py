@@ -0,0 +1,57 @@
+from sqlalchemy import text
+
+from app.core.search_indexes import build_search_indexes, missing_search_indexes
+from app.models.contact import SEARCH_INDEXES, ContactSubmission
+
+
+def drop_search_indexes(engine) -> None:
+    with engine.begin() as conn:
+        for index in SEARCH_INDEXES:
+            conn.execute(text(f'DROP INDEX IF EXISTS "{index.name}"'))
+
+
+def test_builds_missing_indexes_on_every_partition(db, database):
+    db.add(ContactSubmission(first_name="Ada", email="ada@example.com", message="Hello"))
+    db.commit()
+    drop_search_indexes(database)
+
+    with database.connect() as conn:
+        assert len(missing_search_indexes(conn)) == len(SEARCH_INDEXES)
+
+    assert build_search_indexes() == [index.name for index in SEARCH_INDEXES]
+
+    with database.connect() as conn:
+        assert missing_search_indexes(conn) == []
+        # Every partition holds an attached index for each search column
+        unattached = conn.execute(text(
+            "SELECT count(*) FROM pg_inherits part "
+            "JOIN pg_class parent ON parent.oid = part.inhparent "
+            "WHERE parent.relname = 'contact_submissions' AND NOT EXISTS ("
+            "  SELECT 1 FROM pg_inherits idx JOIN pg_index ON pg_index.indexrelid = idx.inhrelid "
+            "  WHERE pg_index.indrelid = part.inhrelid AND idx.inhparent = to_regclass(:name))"
+        ), {"name": SEARCH_INDEXES[0].name}).scalar()
+        assert unattached == 0
+
+
+def test_rerun_is_a_no_op(database):
+    build_search_indexes()
+
+    assert build_search_indexes() == []
+
+
+def test_completes_an_interrupted_build(database):
+    drop_search_indexes(database)
+    index = SEARCH_INDEXES[0]
+    # As left behind when the script stops before attaching any partition
+    with database.begin() as conn:
+        conn.execute(text(
+            f'CREATE INDEX "{index.name}" ON ONLY contact_submissions '
+            f"USING gin (first_name gin_trgm_ops)"
+        ))
+
+    with database.connect() as conn:
+        assert index in missing_search_indexes(conn)
+
+    assert index.name in build_search_indexes()
+    with database.connect() as conn:
+        assert missing_search_indexes(conn) == []
@@ -0,0 +1,83 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from app.models.skill import Skill, SkillCategory, load_published_skill_tree
+
+
+@contextmanager
+def count_statements(engine):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def seed(db, categories: int, skills_per_category: int) -> None:
+    for c in range(categories):
+        category = SkillCategory(
+            name=f"Category {c}",
+            slug=f"category-{c}",
+            icon="code",
+            display_order=categories - c,
+        )
+        category.skills = [
+            Skill(name=f"Skill {c}.{s}", proficiency=50, display_order=s)
+            for s in range(skills_per_category)
+        ]
+        # Unpublished rows must be filtered out in SQL, not loaded
+        category.skills.append(Skill(name=f"Hidden {c}", is_published=False))
+        db.add(category)
+    db.add(SkillCategory(name="Hidden", slug="hidden", icon="code", is_published=False))
+    db.commit()
+    db.expunge_all()
+
+
+@pytest.mark.parametrize("categories, skills_per_category", [(1, 1), (5, 10), (40, 25)])
+def test_query_count_is_constant(db, database, categories, skills_per_category):
+    seed(db, categories, skills_per_category)
+
+    with count_statements(database) as statements:
+        tree = load_published_skill_tree(db)
+
+    assert len(statements) == 2
+    assert len(tree) == categories
+    assert all(len(category["skills"]) == skills_per_category for category in tree)
+
+
+def test_single_category_by_slug(db, database):
+    seed(db, 10, 5)
+
+    with count_statements(database) as statements:
+        tree = load_published_skill_tree(db, slug="category-3")
+
+    assert len(statements) == 2
+    assert [category["slug"] for category in tree] == ["category-3"]
+
+
+def test_unknown_slug_stops_after_one_query(db, database):
+    seed(db, 3, 3)
+
+    with count_statements(database) as statements:
+        assert load_published_skill_tree(db, slug="hidden") == []
+
+    assert len(statements) == 1
+
+
+def test_ordering_and_filtering(db):
+    seed(db, 3, 3)
+
+    tree = load_published_skill_tree(db)
+
+    # display_order was seeded in reverse of creation order
+    assert [category["slug"] for category in tree] == ["category-2", "category-1", "category-0"]
+    for category in tree:
+        assert [skill["display_order"] for skill in category["skills"]] == [0, 1, 2]
+        assert not any(skill["name"].startswith("Hidden") for skill in category["skills"])
@@ -0,0 +1,26 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, inspect, select, text
+
+from app.main import app
+from app.models.project import Project
+
+
+def test_starts_against_a_schema_without_search_vector(db, database):
+    # As created by create_all before full-text search existed
+    with database.begin() as conn:
+        conn.execute(text("ALTER TABLE projects DROP COLUMN search_vector"))
+        conn.execute(insert(Project).values(
+            title="Compiler",
+            slug="compiler",
+            description="A tiny optimizing compiler",
+            technologies=["Rust"],
+        ))
+
+    with TestClient(app) as client:
+        assert client.get("/health").status_code == 200
+
+    inspector = inspect(database)
+    assert "search_vector" in {column["name"] for column in inspector.get_columns("projects")}
+    assert "ix_projects_search_vector" in {index["name"] for index in inspector.get_indexes("projects")}
+    # Existing rows were backfilled so they show up in search
+    assert db.scalar(select(Project.search_vector).where(Project.slug == "compiler")) is not None
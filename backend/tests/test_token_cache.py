@@ -0,0 +1,107 @@
+import time
+from datetime import timedelta
+
+import pytest
+from jose import jwt
+
+from app.core import security
+from app.core.config import settings
+from app.core.security import (
+    AccessClaims,
+    VerifiedTokenCache,
+    create_access_token,
+    decode_access_claims,
+    decode_access_token,
+    revoked_tokens,
+    verified_tokens,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_caches():
+    verified_tokens.clear()
+    revoked_tokens.replace({})
+    yield
+    verified_tokens.clear()
+    revoked_tokens.replace({})
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    """Count signature verifications."""
+    calls = []
+    decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr(security.jwt, "decode", counting_decode)
+    return calls
+
+
+def test_verifies_each_token_once(decodes):
+    token = create_access_token("7")
+
+    assert [decode_access_token(token) for _ in range(5)] == ["7"] * 5
+    assert len(decodes) == 1
+
+
+def test_revocation_applies_to_cached_tokens(decodes):
+    token = create_access_token("7", jti="abc")
+    assert decode_access_token(token) == "7"
+
+    revoked_tokens.add({"abc": time.time() + 60})
+
+    assert decode_access_token(token) is None
+    # Still answered from the cache: revocation needs no re-verification
+    assert len(decodes) == 1
+    assert decode_access_token(create_access_token("7", jti="other")) == "7"
+
+
+def test_bad_tokens_are_not_cached(decodes):
+    forged = jwt.encode({"sub": "7", "jti": "abc", "exp": time.time() + 60}, "wrong-key")
+    expired = create_access_token("7", expires_delta=timedelta(seconds=-1))
+
+    for token in (forged, expired, "not-a-jwt"):
+        assert decode_access_token(token) is None
+        assert decode_access_token(token) is None
+
+    assert len(decodes) == 6
+
+
+def test_tokens_without_jti_are_rejected():
+    token = jwt.encode(
+        {"sub": "7", "exp": time.time() + 60}, settings.SECRET_KEY, algorithm=settings.ALGORITHM
+    )
+
+    assert decode_access_claims(token) is None
+
+
+def test_entries_expire_with_the_token():
+    cache = VerifiedTokenCache(maxsize=10)
+    cache.set(b"live", AccessClaims("7", "a", time.time() + 60))
+    cache.set(b"dead", AccessClaims("7", "b", time.time() - 1))
+
+    assert cache.get(b"live").jti == "a"
+    assert cache.get(b"dead") is None
+
+
+def test_evicts_least_recently_used():
+    cache = VerifiedTokenCache(maxsize=2)
+    expires_at = time.time() + 60
+    cache.set(b"a", AccessClaims("1", "a", expires_at))
+    cache.set(b"b", AccessClaims("2", "b", expires_at))
+    cache.get(b"a")
+    cache.set(b"c", AccessClaims("3", "c", expires_at))
+
+    assert cache.get(b"a") is not None
+    assert cache.get(b"b") is None
+    assert cache.get(b"c") is not None
+
+
+def test_disabled_when_maxsize_is_zero():
+    cache = VerifiedTokenCache(maxsize=0)
+    cache.set(b"a", AccessClaims("1", "a", time.time() + 60))
+
+    assert cache.get(b"a") is None